@@ -7,7 +7,12 @@ import type { WorkItem } from './models.js';
  * The Clawban core never handles HTTP auth tokens directly.
  */
 export interface Adapter {
-  /** Return the current snapshot of tracked work items (id -> WorkItem). */
+  /**
+   * Return the current snapshot of tracked work items (id -> WorkItem).
+   *
+   * A returned Map is used as-is by `tick()` (not copied) and becomes the next tick's previous
+   * snapshot, so return a fresh Map per call; never mutate or reuse one already handed out.
+   */
   fetchSnapshot(): Promise<ReadonlyMap<string, WorkItem> | Readonly<Record<string, WorkItem>>>;
 
   /** Human-readable adapter name (for logging/telemetry). */
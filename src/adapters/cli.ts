@@ -1,19 +1,70 @@
 import { execa } from 'execa';
 
 const DEFAULT_CLI_TIMEOUT_MS = Number.parseInt(process.env.KWF_CLI_TIMEOUT_MS ?? '60000', 10);
+const MAX_RATE_LIMIT_BACKOFF_MS = 60_000;
+// Matches e.g. `RATE_LIMIT_EXCEEDED`, `API rate limit exceeded`, `HTTP 429`, `API Error 429`.
+const RATE_LIMIT_PATTERN = /rate[\s_-]?limit|secondary rate|(?:http|api error|status)[\s:]*429/i;
+
+function defaultRateLimitRetries(): number {
+  const raw = String(process.env.KWF_CLI_RATE_LIMIT_RETRIES ?? '').trim();
+  if (raw) {
+    const parsed = Number.parseInt(raw, 10);
+    return Number.isFinite(parsed) && parsed >= 0 ? parsed : 0;
+  }
+
+  // Unit tests script execa call-by-call; retries would consume their mocks.
+  if (String(process.env.VITEST ?? '').trim()) return 0;
+  return 3;
+}
 
 export class CliError extends Error {
   override name = 'CliError';
+  /** The command's own stderr, kept apart from the message (which echoes the command line). */
+  readonly stderr: string;
+
+  constructor(message: string, opts?: { stderr?: string }) {
+    super(message);
+    this.stderr = opts?.stderr ?? '';
+  }
 }
 
 export class CliRunner {
   private readonly bin: string;
+  private readonly rateLimitRetries: number;
+  private readonly backoffBaseMs: number;
 
-  constructor(bin: string) {
+  constructor(
+    bin: string,
+    opts?: {
+      /** Retries for rate-limit-shaped failures (default 3, or KWF_CLI_RATE_LIMIT_RETRIES). */
+      rateLimitRetries?: number;
+      /** Backoff unit: waits min(60s, base * 2^attempt) plus up to one base of jitter. */
+      backoffBaseMs?: number;
+    },
+  ) {
     this.bin = bin;
+    this.rateLimitRetries = opts?.rateLimitRetries ?? defaultRateLimitRetries();
+    this.backoffBaseMs = opts?.backoffBaseMs ?? 1000;
   }
 
   async run(args: readonly string[]): Promise<string> {
+    for (let attempt = 0; ; attempt += 1) {
+      try {
+        return await this.runOnce(args);
+      } catch (err: any) {
+        // Back off on rate limits so repeated polling doesn't stampede the API. Only the CLI's
+        // stderr is classified: the message echoes args, which carry comment bodies and titles.
+        const rateLimited = err instanceof CliError && RATE_LIMIT_PATTERN.test(err.stderr);
+        if (!rateLimited || attempt >= this.rateLimitRetries) throw err;
+
+        const backoffMs = Math.min(MAX_RATE_LIMIT_BACKOFF_MS, this.backoffBaseMs * 2 ** attempt)
+          + Math.random() * this.backoffBaseMs;
+        await new Promise((resolve) => setTimeout(resolve, backoffMs));
+      }
+    }
+  }
+
+  private async runOnce(args: readonly string[]): Promise<string> {
     try {
       const proc = await execa(this.bin, [...args], {
         stdout: 'pipe',
@@ -43,6 +94,7 @@ export class CliRunner {
         : '';
       throw new CliError(
         `${this.bin} command failed: ${this.bin} ${args.join(' ')}\n${message}${timeoutNote}${stderr ? `\n${stderr}` : ''}`.trim(),
+        { stderr },
       );
     }
   }
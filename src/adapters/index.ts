@@ -1,2 +1,3 @@
 export * from './cli.js';
 export * from './plane.js';
+export * from './plane_api.js';
@@ -7,11 +7,23 @@ import * as path from 'node:path';
 
 import { z } from 'zod';
 
+import { writeFileAtomic } from '../atomic_file.js';
 import { Stage } from '../stage.js';
 
+import {
+  isPlaneAuthFailure,
+  PlaneApiClient,
+  PlaneApiError,
+  type PlaneApiBroker,
+  type PlaneApiRequest,
+} from './plane_api.js';
+
 const PLANE_CACHE_DIR = process.env.KWF_PLANE_CACHE_DIR?.trim() || '.tmp/kwf-plane-cache';
 const PLANE_CACHE_EVENT_FILE = process.env.KWF_PLANE_CACHE_EVENT_FILE?.trim() || '.tmp/kwf-plane-webhook-events.json';
 const PLANE_CACHE_RECONCILE_MS = Number.parseInt(process.env.KWF_PLANE_CACHE_RECONCILE_MS ?? '900000', 10);
+const PLANE_BULK_CONCURRENCY = 8;
+const PLANE_MAX_LIST_PAGES = 50;
+const PLANE_SELECTION_CACHE_TTL_MS = Number.parseInt(process.env.KWF_PLANE_SELECTION_CACHE_TTL_MS ?? '5000', 10);
 
 function isPlaneCacheEnabled(): boolean {
   const raw = String(process.env.KWF_PLANE_CACHE_ENABLED ?? '').trim().toLowerCase();
@@ -23,9 +35,45 @@ function isPlaneCacheEnabled(): boolean {
   return true;
 }
 
+// Plane timestamps repeat across every list/snapshot pass (the same issues, tick after tick),
+// so string -> epoch ms is memoized. Dates are mutable, so callers get a fresh instance.
+const PLANE_DATE_CACHE_MAX = 4096;
+const planeDateMsCache = new Map<string, number>();
+
 function parsePlaneDate(v: string): Date | undefined {
-  const d = new Date(v);
-  return Number.isNaN(d.getTime()) ? undefined : d;
+  let ms = planeDateMsCache.get(v);
+  if (ms === undefined) {
+    ms = Date.parse(v);
+    // Evict the oldest entry: timestamps change as issues are edited, and a cache that
+    // stopped admitting new ones once full would go stale for exactly those.
+    if (planeDateMsCache.size >= PLANE_DATE_CACHE_MAX) {
+      planeDateMsCache.delete(planeDateMsCache.keys().next().value!);
+    }
+    planeDateMsCache.set(v, ms);
+  }
+  return Number.isNaN(ms) ? undefined : new Date(ms);
+}
+
+// Most issues share a few label sets, so snapshot items reuse one frozen array per distinct
+// set. Besides the heap savings, unchanged labels then compare by identity in diffWorkItems.
+const PLANE_LABEL_SET_CACHE_MAX = 1024;
+const planeLabelSetCache = new Map<string, readonly string[]>();
+const NO_LABELS: readonly string[] = Object.freeze([]);
+
+function internLabels(labels: readonly string[]): readonly string[] {
+  if (labels.length === 0) return NO_LABELS;
+  // JSON keys can't collide the way a separator join can (`['a\u0000b']` vs `['a', 'b']`).
+  const key = JSON.stringify(labels);
+  let shared = planeLabelSetCache.get(key);
+  if (!shared) {
+    shared = Object.freeze([...labels]);
+    // Oldest-first eviction keeps the table tracking label sets still in use.
+    if (planeLabelSetCache.size >= PLANE_LABEL_SET_CACHE_MAX) {
+      planeLabelSetCache.delete(planeLabelSetCache.keys().next().value!);
+    }
+    planeLabelSetCache.set(key, shared);
+  }
+  return shared;
 }
 
 function normalizePlaneIssuesList(raw: unknown): any[] {
@@ -45,6 +93,8 @@ type PlaneIssueCache = {
   projectId: string;
   refreshedAt?: string;
   updatedAt?: string;
+  /** ETag of the last full issues-list API response, replayed as If-None-Match. */
+  etag?: string;
   issuesById: Record<string, any>;
 };
 
@@ -218,6 +268,56 @@ function assigneeMatchesSelf(
   return actorKeys(assignee).some((k) => meKeys.has(k));
 }
 
+/**
+ * Snapshot items in `stage`, in one pass. When `me` is known and any candidate carries assignee
+ * data, only self-assigned items are kept; some Plane list surfaces omit assignees when the
+ * server-side assignee filter is used, so we avoid dropping everything in that case.
+ */
+function ownItemsInStage(
+  items: Iterable<WorkItem>,
+  stage: import('../stage.js').StageKey,
+  me: { id?: string; username?: string; name?: string },
+): WorkItem[] {
+  const inStage: WorkItem[] = [];
+  const own: WorkItem[] = [];
+  let hasAnyAssigneeData = false;
+
+  for (const item of items) {
+    if (item.stage.key !== stage) continue;
+    inStage.push(item);
+    if (!me.id) continue;
+    const assignees = item.assignees ?? [];
+    if (assignees.length === 0) continue;
+    hasAnyAssigneeData = true;
+    if (assignees.some((a) => assigneeMatchesSelf(a, me))) own.push(item);
+  }
+
+  return hasAnyAssigneeData ? own : inStage;
+}
+
+/** {@link ownItemsInStage} for raw Plane issues: `matches` narrows candidates, same assignee rule. */
+function ownRawIssues(
+  issues: Iterable<any>,
+  matches: ((issue: any) => boolean) | undefined,
+  me: { id?: string; username?: string; name?: string },
+): any[] {
+  const candidates: any[] = [];
+  const own: any[] = [];
+  let hasAnyAssigneeData = false;
+
+  for (const issue of issues) {
+    if (matches && !matches(issue)) continue;
+    candidates.push(issue);
+    if (!me.id) continue;
+    const assigneeIds = extractIssueAssigneeIds(issue);
+    if (assigneeIds.length === 0) continue;
+    hasAnyAssigneeData = true;
+    if (assigneeIds.some((assigneeId) => assigneeMatchesSelf(assigneeId, me))) own.push(issue);
+  }
+
+  return hasAnyAssigneeData ? own : candidates;
+}
+
 function extractIssueCreatorId(raw: unknown): string | undefined {
   if (!raw || typeof raw !== 'object') return undefined;
   const issue: any = raw;
@@ -329,13 +429,16 @@ function extractIssueLabels(raw: unknown): string[] {
   if (!raw || typeof raw !== 'object') return [];
   const issue: any = raw;
   const labels = Array.isArray(issue.labels) ? issue.labels : [];
-  return labels
-    .map((label: any) => {
-      if (typeof label === 'string') return label.trim();
-      if (label && typeof label === 'object' && typeof label.name === 'string') return label.name.trim();
-      return '';
-    })
-    .filter((label: string) => label.length > 0);
+  const out: string[] = [];
+  for (const label of labels) {
+    const name = typeof label === 'string'
+      ? label.trim()
+      : label && typeof label === 'object' && typeof label.name === 'string'
+        ? label.name.trim()
+        : '';
+    if (name) out.push(name);
+  }
+  return out;
 }
 
 function extractIssueUpdatedAt(raw: unknown): Date | undefined {
@@ -397,9 +500,12 @@ type PlaneState = {
 };
 
 /**
- * Plane adapter (CLI-auth only).
+ * Plane adapter.
  *
- * Uses https://github.com/simonvanlaak/plane-cli (a2c-based).
+ * Uses https://github.com/simonvanlaak/plane-cli (a2c-based). When PLANE_API_KEY is set,
+ * issue reads, listing, stage updates, comments and links go straight to the Plane REST
+ * API via {@link PlaneApiClient} and fall back to the CLI where the API call fails
+ * (except 401/403, which are surfaced: the CLI would be using the same rejected key).
  *
  * By default this calls a `plane` wrapper on PATH, e.g. plane-cli's `scripts/plane`.
  *
@@ -409,6 +515,7 @@ type PlaneState = {
  */
 export class PlaneAdapter implements Adapter {
   private readonly cli: CliRunner;
+  private readonly api: PlaneApiClient;
   private readonly baseArgs: readonly string[];
   // workspaceSlug is kept for config compatibility; current plane CLI reads workspace from env.
   private readonly workspaceSlug: string;
@@ -425,7 +532,11 @@ export class PlaneAdapter implements Adapter {
    */
   private readonly formatArgs: readonly string[];
   private readonly issueProjectCache = new Map<string, string>();
+  /** Project probes in flight, so concurrent calls for one issue share a lookup. */
+  private readonly issueProjectLookups = new Map<string, Promise<string>>();
   private readonly projectIdentifierCache = new Map<string, string>();
+  /** Short-lived selection results keyed by project/assignee/state; see listIssuesForSelection. */
+  private readonly selectionCache = new Map<string, { at: number; projectId: string; issues: any[] }>();
   private membersByDisplayNameCache?: Map<string, string>;
 
   constructor(opts: {
@@ -442,10 +553,13 @@ export class PlaneAdapter implements Adapter {
     orderField?: string;
     /** Override JSON output flags if your plane wrapper differs. */
     formatArgs?: readonly string[];
+    /** Rate-limit/concurrency gate for API calls; defaults to the process-wide broker. */
+    apiBroker?: PlaneApiBroker;
   }) {
     this.cli = new CliRunner(opts.bin ?? 'plane');
     this.baseArgs = opts.baseArgs ?? [];
     this.workspaceSlug = opts.workspaceSlug;
+    this.api = new PlaneApiClient({ workspaceSlug: opts.workspaceSlug, broker: opts.apiBroker });
     this.whoamiCachePath = path.resolve(process.cwd(), '.tmp', 'kwf-plane-identity.json');
 
     const ids = (opts.projectIds && opts.projectIds.length > 0 ? [...opts.projectIds] : []).filter(Boolean);
@@ -465,12 +579,13 @@ export class PlaneAdapter implements Adapter {
     return 'plane';
   }
 
-  private async writeJsonAtomic(filePath: string, value: unknown): Promise<void> {
-    const dir = path.dirname(filePath);
-    await fs.mkdir(dir, { recursive: true });
-    const tempPath = `${filePath}.${process.pid}.${Date.now()}.tmp`;
-    await fs.writeFile(tempPath, `${JSON.stringify(value, null, 2)}\n`, 'utf-8');
-    await fs.rename(tempPath, filePath);
+  private async writeJsonAtomic(filePath: string, value: unknown, opts?: { compact?: boolean }): Promise<void> {
+    // `compact` is for the per-project issue caches: large and machine-only, so indentation is
+    // pure encode/size overhead (pipe through `jq` to inspect). The small webhook event
+    // queue stays indented for reading by hand.
+    // Cache saves always carry a fresh updatedAt, so there is no unchanged-content check here.
+    const json = opts?.compact ? JSON.stringify(value) : JSON.stringify(value, null, 2);
+    await writeFileAtomic(filePath, `${json}\n`);
   }
 
   private async loadIssueCache(projectId: string): Promise<PlaneIssueCache | undefined> {
@@ -485,6 +600,7 @@ export class PlaneAdapter implements Adapter {
         projectId,
         refreshedAt: typeof parsed.refreshedAt === 'string' ? parsed.refreshedAt : undefined,
         updatedAt: typeof parsed.updatedAt === 'string' ? parsed.updatedAt : undefined,
+        etag: typeof parsed.etag === 'string' && parsed.etag ? parsed.etag : undefined,
         issuesById: { ...(parsed.issuesById ?? {}) },
       };
     } catch {
@@ -492,13 +608,18 @@ export class PlaneAdapter implements Adapter {
     }
   }
 
-  private async saveIssueCache(projectId: string, issues: any[], opts?: { refreshedAt?: boolean }): Promise<PlaneIssueCache> {
+  private async saveIssueCache(
+    projectId: string,
+    issues: any[],
+    opts?: { refreshedAt?: boolean; etag?: string },
+  ): Promise<PlaneIssueCache> {
     const now = new Date().toISOString();
     const cache: PlaneIssueCache = {
       version: 1,
       projectId,
       refreshedAt: opts?.refreshedAt === false ? undefined : now,
       updatedAt: now,
+      etag: opts?.etag,
       issuesById: Object.fromEntries(
         normalizePlaneIssuesList(issues)
           .filter((issue) => issue && issue.id != null)
@@ -509,7 +630,7 @@ export class PlaneAdapter implements Adapter {
       const prior = await this.loadIssueCache(projectId);
       cache.refreshedAt = prior?.refreshedAt;
     }
-    await this.writeJsonAtomic(issueCachePath(projectId), cache);
+    await this.writeJsonAtomic(issueCachePath(projectId), cache, { compact: true });
     return cache;
   }
 
@@ -578,9 +699,10 @@ export class PlaneAdapter implements Adapter {
       projectId,
       refreshedAt: cache.refreshedAt,
       updatedAt: new Date().toISOString(),
+      etag: cache.etag,
       issuesById,
     };
-    await this.writeJsonAtomic(issueCachePath(projectId), next);
+    await this.writeJsonAtomic(issueCachePath(projectId), next, { compact: true });
     return next;
   }
 
@@ -594,7 +716,7 @@ export class PlaneAdapter implements Adapter {
     }
 
     if (!isPlaneCacheEnabled()) {
-      return normalizePlaneIssuesList((await this.runJson(['issues', 'list', '-p', projectId])) ?? []);
+      return await this.listProjectIssuesRaw(projectId);
     }
 
     const now = Date.now();
@@ -609,8 +731,18 @@ export class PlaneAdapter implements Adapter {
     const refreshedAtMs = effectiveCache?.refreshedAt ? Date.parse(effectiveCache.refreshedAt) : Number.NaN;
     const stale = !effectiveCache || !Number.isFinite(refreshedAtMs) || (now - refreshedAtMs) >= PLANE_CACHE_RECONCILE_MS;
     if (stale) {
-      const issues = normalizePlaneIssuesList((await this.runJson(['issues', 'list', '-p', projectId])) ?? []);
-      await this.saveIssueCache(projectId, issues, { refreshedAt: true });
+      const listUrl = this.api.hasCredentials() ? this.issuesListUrl(projectId) : undefined;
+      if (listUrl && effectiveCache?.etag) {
+        this.api.rememberConditional(listUrl, {
+          etag: effectiveCache.etag,
+          body: Object.values(effectiveCache.issuesById ?? {}),
+        });
+      }
+      const issues = await this.listProjectIssuesRaw(projectId);
+      // Page 1's ETag doesn't cover later pages, so only single-page lists are replayable.
+      const listed = listUrl ? this.api.conditionalEntry(listUrl) : undefined;
+      const etag = listed && !(listed.body as any)?.next_page_results ? listed.etag : undefined;
+      await this.saveIssueCache(projectId, issues, { refreshedAt: true, etag });
       return issues;
     }
 
@@ -626,9 +758,39 @@ export class PlaneAdapter implements Adapter {
   }
 
   private async getIssueRaw(projectId: string, id: string): Promise<any> {
+    if (this.api.hasCredentials()) {
+      try {
+        const res = await this.sendWorkItemRequest(projectId, `${String(id)}/`, { method: 'GET' }, 'Plane issues API');
+        if (isPlaneAuthFailure(res.status)) {
+          throw new PlaneApiError(`Plane issues API failed: HTTP ${res.status}`, res.status);
+        }
+        if (res.ok) {
+          const issue = await res.json();
+          if (issue && typeof issue === 'object') {
+            return (await this.hydrateIssueStateNames(projectId, [issue]))[0];
+          }
+        }
+      } catch (err) {
+        if (err instanceof PlaneApiError && isPlaneAuthFailure(err.status)) throw err;
+        // otherwise fall through to the CLI
+      }
+    }
     return (await this.runJson(['issues', 'get', '-p', projectId, String(id)])) ?? {};
   }
 
+  /** Full (unfiltered) issue list for a project: REST API when credentials exist, else CLI. */
+  private async listProjectIssuesRaw(projectId: string): Promise<any[]> {
+    if (this.api.hasCredentials()) {
+      try {
+        return await this.hydrateIssueStateNames(projectId, await this.listIssuesViaApi(projectId));
+      } catch (err) {
+        if (err instanceof PlaneApiError && isPlaneAuthFailure(err.status)) throw err;
+        // otherwise fall through to the CLI
+      }
+    }
+    return normalizePlaneIssuesList((await this.runJson(['issues', 'list', '-p', projectId])) ?? []);
+  }
+
   private async getProjectIdentifier(projectId: string): Promise<string | undefined> {
     const cached = this.projectIdentifierCache.get(projectId);
     if (cached) return cached;
@@ -669,39 +831,33 @@ export class PlaneAdapter implements Adapter {
     return serializedJson.includes(marker);
   }
 
-  private async postCommentViaApi(projectId: string, id: string, body: string, operationId?: string): Promise<void> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane comment API');
-    }
-
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/work-items/${String(id)}/comments/`;
-    const issueUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/issues/${String(id)}/comments/`;
+  /**
+   * Send a per-work-item request, falling back from `/work-items/` to the legacy `/issues/`
+   * path on 404/405 (older Plane deployments).
+   */
+  private async sendWorkItemRequest(
+    projectId: string,
+    suffix: string,
+    req: PlaneApiRequest,
+    what: string,
+  ): Promise<Response> {
+    const res = await this.api.request(this.api.projectUrl(projectId, `work-items/${suffix}`, what), req, what);
+    if (res.ok || (res.status !== 404 && res.status !== 405)) return res;
+    return await this.api.request(this.api.projectUrl(projectId, `issues/${suffix}`, what), req, what);
+  }
 
+  private async postCommentViaApi(projectId: string, id: string, body: string, operationId?: string): Promise<void> {
+    const what = 'Plane comment API';
+    this.api.requireCredentials(what);
     const commentHtml = `${await this.renderCommentHtmlWithMentions(body)}${this.renderCommentOperationMarker(operationId)}`;
     const commentJson = await this.renderCommentJsonWithMentions(body);
 
-    let res = await fetch(workItemUrl, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-api-key': apiKey,
-      },
-      body: JSON.stringify({ comment_html: commentHtml, comment_json: commentJson }),
-    });
-
-    // Back-compat fallback for older Plane deployments.
-    if (!res.ok && (res.status === 404 || res.status === 405)) {
-      res = await fetch(issueUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'x-api-key': apiKey,
-        },
-        body: JSON.stringify({ comment_html: commentHtml, comment_json: commentJson }),
-      });
-    }
+    const res = await this.sendWorkItemRequest(
+      projectId,
+      `${String(id)}/comments/`,
+      { method: 'POST', body: { comment_html: commentHtml, comment_json: commentJson } },
+      what,
+    );
 
     if (!res.ok) {
       const txt = await res.text().catch(() => '');
@@ -711,57 +867,29 @@ export class PlaneAdapter implements Adapter {
 
 
   private async listCommentsViaApi(projectId: string, id: string, opts?: { limit?: number }): Promise<any[]> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane comments API');
-    }
-
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemBaseUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/work-items/${String(id)}/comments/`;
-    const issueBaseUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/issues/${String(id)}/comments/`;
-
-    const sleep = async (ms: number): Promise<void> => {
-      await new Promise((resolve) => setTimeout(resolve, ms));
-    };
+    const what = 'Plane comments API';
+    const workItemBaseUrl = this.api.projectUrl(projectId, `work-items/${String(id)}/comments/`, what);
+    const issueBaseUrl = this.api.projectUrl(projectId, `issues/${String(id)}/comments/`, what);
 
     const fetchPage = async (url: string): Promise<{ results: any[]; next?: string | null }> => {
-      let attempt = 0;
-      while (true) {
-        attempt += 1;
-        const res = await fetch(url, {
-          method: 'GET',
-          headers: {
-            'x-api-key': apiKey,
-          },
-        });
+      const res = await this.api.request(url, { method: 'GET' }, what);
 
-        if (res.ok) {
-          const json = await res.json().catch(() => ({}));
-          if (Array.isArray(json)) return { results: json, next: null };
-
-          if (json && typeof json === 'object') {
-            const obj: any = json;
-            const results = Array.isArray(obj.results) ? obj.results : [];
-            const next = typeof obj.next === 'string' ? obj.next : null;
-            return { results, next };
-          }
+      if (res.ok) {
+        const json = await res.json().catch(() => ({}));
+        if (Array.isArray(json)) return { results: json, next: null };
 
-          return { results: [], next: null };
+        if (json && typeof json === 'object') {
+          const obj: any = json;
+          const results = Array.isArray(obj.results) ? obj.results : [];
+          const next = typeof obj.next === 'string' ? obj.next : null;
+          return { results, next };
         }
 
-        const txt = await res.text().catch(() => '');
-        if (res.status === 429 && attempt < 4) {
-          const retryAfterRaw = res.headers.get('retry-after');
-          const retryAfterSeconds = Number(retryAfterRaw);
-          const backoffMs = Number.isFinite(retryAfterSeconds) && retryAfterSeconds > 0
-            ? retryAfterSeconds * 1000
-            : attempt * 1500;
-          await sleep(backoffMs);
-          continue;
-        }
-
-        throw new Error(`Plane comments API failed: HTTP ${res.status} ${txt}`);
+        return { results: [], next: null };
       }
+
+      const txt = await res.text().catch(() => '');
+      throw new Error(`Plane comments API failed: HTTP ${res.status} ${txt}`);
     };
 
     const fetchAll = async (baseUrl: string): Promise<any[]> => {
@@ -811,30 +939,7 @@ export class PlaneAdapter implements Adapter {
   }
 
   private async listLinksViaApi(projectId: string, id: string): Promise<any[]> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane links API');
-    }
-
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/work-items/${String(id)}/links/`;
-    const issueUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/issues/${String(id)}/links/`;
-
-    let res = await fetch(workItemUrl, {
-      method: 'GET',
-      headers: {
-        'x-api-key': apiKey,
-      },
-    });
-
-    if (!res.ok && (res.status === 404 || res.status === 405)) {
-      res = await fetch(issueUrl, {
-        method: 'GET',
-        headers: {
-          'x-api-key': apiKey,
-        },
-      });
-    }
+    const res = await this.sendWorkItemRequest(projectId, `${String(id)}/links/`, { method: 'GET' }, 'Plane links API');
 
     if (!res.ok) {
       const txt = await res.text().catch(() => '');
@@ -848,38 +953,16 @@ export class PlaneAdapter implements Adapter {
   }
 
   private async createLinkViaApi(projectId: string, id: string, link: { title?: string; url: string }): Promise<void> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane links API');
-    }
-
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/work-items/${String(id)}/links/`;
-    const issueUrl = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/issues/${String(id)}/links/`;
-
     const payload: any = { url: String(link.url || '').trim() };
     const title = String(link.title ?? '').trim();
     if (title) payload.title = title;
 
-    let res = await fetch(workItemUrl, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-api-key': apiKey,
-      },
-      body: JSON.stringify(payload),
-    });
-
-    if (!res.ok && (res.status === 404 || res.status === 405)) {
-      res = await fetch(issueUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'x-api-key': apiKey,
-        },
-        body: JSON.stringify(payload),
-      });
-    }
+    const res = await this.sendWorkItemRequest(
+      projectId,
+      `${String(id)}/links/`,
+      { method: 'POST', body: payload },
+      'Plane links API',
+    );
 
     if (!res.ok) {
       const txt = await res.text().catch(() => '');
@@ -888,39 +971,17 @@ export class PlaneAdapter implements Adapter {
   }
 
   private async updateCommentViaApi(projectId: string, issueId: string, commentId: string, body: string): Promise<void> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane comments API');
-    }
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemUrl =
-      `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}` +
-      `/work-items/${String(issueId)}/comments/${String(commentId)}/`;
-    const issueUrl =
-      `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}` +
-      `/issues/${String(issueId)}/comments/${String(commentId)}/`;
+    const what = 'Plane comments API';
+    this.api.requireCredentials(what);
     const commentHtml = await this.renderCommentHtmlWithMentions(body);
     const commentJson = await this.renderCommentJsonWithMentions(body);
 
-    let res = await fetch(workItemUrl, {
-      method: 'PATCH',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-api-key': apiKey,
-      },
-      body: JSON.stringify({ comment_html: commentHtml, comment_json: commentJson }),
-    });
-
-    if (!res.ok && (res.status === 404 || res.status === 405)) {
-      res = await fetch(issueUrl, {
-        method: 'PATCH',
-        headers: {
-          'Content-Type': 'application/json',
-          'x-api-key': apiKey,
-        },
-        body: JSON.stringify({ comment_html: commentHtml, comment_json: commentJson }),
-      });
-    }
+    const res = await this.sendWorkItemRequest(
+      projectId,
+      `${String(issueId)}/comments/${String(commentId)}/`,
+      { method: 'PATCH', body: { comment_html: commentHtml, comment_json: commentJson } },
+      what,
+    );
 
     if (!res.ok) {
       const txt = await res.text().catch(() => '');
@@ -929,33 +990,12 @@ export class PlaneAdapter implements Adapter {
   }
 
   private async deleteCommentViaApi(projectId: string, issueId: string, commentId: string): Promise<void> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane comments API');
-    }
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const workItemUrl =
-      `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}` +
-      `/work-items/${String(issueId)}/comments/${String(commentId)}/`;
-    const issueUrl =
-      `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}` +
-      `/issues/${String(issueId)}/comments/${String(commentId)}/`;
-
-    let res = await fetch(workItemUrl, {
-      method: 'DELETE',
-      headers: {
-        'x-api-key': apiKey,
-      },
-    });
-
-    if (!res.ok && (res.status === 404 || res.status === 405)) {
-      res = await fetch(issueUrl, {
-        method: 'DELETE',
-        headers: {
-          'x-api-key': apiKey,
-        },
-      });
-    }
+    const res = await this.sendWorkItemRequest(
+      projectId,
+      `${String(issueId)}/comments/${String(commentId)}/`,
+      { method: 'DELETE' },
+      'Plane comments API',
+    );
 
     if (!res.ok) {
       const txt = await res.text().catch(() => '');
@@ -1232,6 +1272,15 @@ export class PlaneAdapter implements Adapter {
     const cached = this.issueProjectCache.get(issueId);
     if (cached) return cached;
 
+    let lookup = this.issueProjectLookups.get(issueId);
+    if (!lookup) {
+      lookup = this.probeProjectIdForIssue(issueId, forWhat).finally(() => this.issueProjectLookups.delete(issueId));
+      this.issueProjectLookups.set(issueId, lookup);
+    }
+    return await lookup;
+  }
+
+  private async probeProjectIdForIssue(issueId: string, forWhat: string): Promise<string> {
     for (const projectId of this.projectIds) {
       try {
         const raw = await this.getIssueRaw(projectId, issueId);
@@ -1397,15 +1446,8 @@ export class PlaneAdapter implements Adapter {
       });
       const snap = await this.fetchSnapshotForProject(projectId, issues);
 
-      let items = [...snap.values()].filter((i) => i.stage.key === stage);
-
       // Hard safety: if assignee data is present, enforce self-assigned only.
-      if (meId) {
-        const hasAnyAssigneeData = items.some((i) => (i.assignees ?? []).length > 0);
-        if (hasAnyAssigneeData) {
-          items = items.filter((i) => (i.assignees ?? []).some((a) => assigneeMatchesSelf(a, me)));
-        }
-      }
+      const items = ownItemsInStage(snap.values(), stage, me);
 
       for (const item of items) {
         // Defensive live-stage verification: snapshot cache can lag behind manual
@@ -1558,19 +1600,16 @@ export class PlaneAdapter implements Adapter {
         assigneeId: meId || undefined,
         stateId: doneStateId,
       });
-      let items = doneStateId
-        ? issues
-        : issues.filter((issue) => {
-            const stateName = extractIssueStageName(issue);
-            return typeof stateName === 'string' && stateName.trim().toLowerCase() === 'done';
-          });
-
-      if (meId) {
-        const hasAnyAssigneeData = items.some((issue) => extractIssueAssigneeIds(issue).length > 0);
-        if (hasAnyAssigneeData) {
-          items = items.filter((issue) => extractIssueAssigneeIds(issue).some((assigneeId) => assigneeMatchesSelf(assigneeId, me)));
-        }
-      }
+      const items = ownRawIssues(
+        issues,
+        doneStateId
+          ? undefined
+          : (issue) => {
+              const stateName = extractIssueStageName(issue);
+              return typeof stateName === 'string' && stateName.trim().toLowerCase() === 'done';
+            },
+        me,
+      );
 
       for (const issue of items) {
         const id = idFromUnknown((issue as any)?.id);
@@ -1595,34 +1634,88 @@ export class PlaneAdapter implements Adapter {
     return out.trim().length > 0 ? JSON.parse(out) : [];
   }
 
-  private async listIssuesViaApi(projectId: string): Promise<any[]> {
-    const apiKey = process.env.PLANE_API_KEY;
-    if (!apiKey) {
-      throw new Error('PLANE_API_KEY is required for Plane issues API');
+  private async listIssuesViaApi(projectId: string, opts?: { assigneeId?: string; stateId?: string }): Promise<any[]> {
+    const what = 'Plane issues API';
+    const firstUrl = this.issuesListUrl(projectId, opts);
+    const first: any = await this.api.getJson(firstUrl, what);
+    // Copy: `first` may be the client's remembered ETag body.
+    const out = [...normalizePlaneIssuesList(first)];
+
+    const nextCursor = first?.next_page_results && typeof first?.next_cursor === 'string' ? first.next_cursor : '';
+    if (!nextCursor) return out;
+
+    // Full reads feed snapshots: a truncated list would read as deletions, so past the page
+    // cap throw (callers fall back to the CLI) rather than truncate.
+    const tooManyPages = (): Error => new Error(`${what}: issue list exceeds ${PLANE_MAX_LIST_PAGES} pages`);
+
+    // Plane paginates with `<perPage>:<page>:<offset>` cursors and reports total_pages, so
+    // once page 1 is in, the remaining pages are independent and can be fetched concurrently.
+    const [perPageRaw, pageRaw] = nextCursor.split(':');
+    const perPage = Number(perPageRaw);
+    const nextPage = Number(pageRaw);
+    const totalPages = Number(first?.total_pages);
+    if (Number.isInteger(perPage) && Number.isInteger(nextPage) && Number.isInteger(totalPages) && totalPages > nextPage) {
+      if (totalPages > PLANE_MAX_LIST_PAGES) throw tooManyPages();
+      const pageUrl = (page: number): string => {
+        const u = new URL(firstUrl);
+        u.searchParams.set('cursor', `${perPage}:${page}:0`);
+        return u.toString();
+      };
+      const pages = await Promise.all(
+        Array.from({ length: totalPages - nextPage }, (_, i) => this.api.getJson(pageUrl(nextPage + i), what)),
+      );
+      return out.concat(...pages.map((page) => normalizePlaneIssuesList(page)));
     }
 
-    const base = (process.env.PLANE_BASE_URL || 'https://api.plane.so').replace(/\/$/, '');
-    const url = `${base}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/issues/`;
-
-    const res = await fetch(url, {
-      method: 'GET',
-      headers: {
-        'x-api-key': apiKey,
-      },
-    });
-
-    if (!res.ok) {
-      const txt = await res.text().catch(() => '');
-      throw new Error(`Plane issues API failed: HTTP ${res.status} ${txt}`);
+    // No usable page count: follow next_cursor sequentially.
+    let cursor: string = nextCursor;
+    for (let pageCount = 1; cursor; pageCount += 1) {
+      if (pageCount >= PLANE_MAX_LIST_PAGES) throw tooManyPages();
+      const u = new URL(firstUrl);
+      u.searchParams.set('cursor', cursor);
+      // Each page URL keeps its own ETag; unchanged pages come back as 304s.
+      const page: any = await this.api.getJson(u.toString(), what);
+      out.push(...normalizePlaneIssuesList(page));
+      cursor = page?.next_page_results && typeof page?.next_cursor === 'string' ? page.next_cursor : '';
     }
+    return out;
+  }
 
-    const json = await res.json().catch(() => ([]));
-    return normalizePlaneIssuesList(json);
+  /**
+   * Issues list URL; state/assignee filters are pushed to Plane as query params so only the
+   * matching slice is transferred. Callers still filter client-side in case they're ignored.
+   */
+  private issuesListUrl(projectId: string, opts?: { assigneeId?: string; stateId?: string }): string {
+    const url = this.api.projectUrl(projectId, 'issues/', 'Plane issues API');
+    const query = new URLSearchParams();
+    if (opts?.stateId) query.set('state', opts.stateId);
+    if (opts?.assigneeId) query.set('assignees', opts.assigneeId);
+    const qs = query.toString();
+    return qs ? `${url}?${qs}` : url;
   }
 
+  /**
+   * One tick asks for the same slices repeatedly (in-progress check, backlog, done repair...),
+   * so results are reused for a few seconds. Any mutation through this adapter drops the
+   * project's entries (see invalidateSelectionCache).
+   */
   private async listIssuesForSelection(projectId: string, opts?: { assigneeId?: string; stateId?: string }): Promise<any[]> {
+    const ttlMs = Number.isFinite(PLANE_SELECTION_CACHE_TTL_MS) ? PLANE_SELECTION_CACHE_TTL_MS : 5000;
+    const key = `${projectId}\u0000${opts?.assigneeId ?? ''}\u0000${opts?.stateId ?? ''}`;
+    const hit = this.selectionCache.get(key);
+    if (hit && performance.now() - hit.at < ttlMs) return [...hit.issues];
+
+    const issues = await this.listIssuesForSelectionUncached(projectId, opts);
+    if (ttlMs > 0) this.selectionCache.set(key, { at: performance.now(), projectId, issues });
+    return [...issues];
+  }
+
+  private async listIssuesForSelectionUncached(
+    projectId: string,
+    opts?: { assigneeId?: string; stateId?: string },
+  ): Promise<any[]> {
     try {
-      const viaApi = await this.listIssuesViaApi(projectId);
+      const viaApi = await this.listIssuesViaApi(projectId, opts);
       const filtered = await this.filterIssuesClientSide(projectId, viaApi, opts);
       return await this.hydrateIssueStateNames(projectId, filtered);
     } catch {
@@ -1632,6 +1725,12 @@ export class PlaneAdapter implements Adapter {
     }
   }
 
+  private invalidateSelectionCache(projectId: string): void {
+    for (const [key, entry] of this.selectionCache) {
+      if (entry.projectId === projectId) this.selectionCache.delete(key);
+    }
+  }
+
   private async filterIssuesClientSide(
     projectId: string,
     issues: any[],
@@ -1722,6 +1821,7 @@ export class PlaneAdapter implements Adapter {
             issueId,
             creatorId,
           ]);
+          this.invalidateSelectionCache(projectId);
         } catch {
           // Best-effort only, never fail listing/selection on assign drift healing.
         }
@@ -1749,17 +1849,8 @@ export class PlaneAdapter implements Adapter {
       });
 
       const snap = await this.fetchSnapshotForProject(projectId, issues);
-      let backlog = [...snap.values()].filter((i) => i.stage.key === 'stage:todo');
-
       // Hard safety: if assignee data is present, enforce self-assigned only.
-      // Some Plane list surfaces omit assignees when server-side --assignee is used,
-      // so we avoid dropping all items when assignment info is unavailable.
-      if (meId) {
-        const hasAnyAssigneeData = backlog.some((i) => (i.assignees ?? []).length > 0);
-        if (hasAnyAssigneeData) {
-          backlog = backlog.filter((i) => (i.assignees ?? []).some((a) => assigneeMatchesSelf(a, me)));
-        }
-      }
+      const backlog = ownItemsInStage(snap.values(), 'stage:todo', me);
 
       const byId = new Map(issues.map((x: any) => [String(x.id), x] as const));
       for (const item of backlog) {
@@ -2078,9 +2169,75 @@ export class PlaneAdapter implements Adapter {
     return [];
   }
 
+  /** Warm the project and state-id lookups setStage needs; changes nothing in Plane. */
+  async prepareStage(id: string, stage: import('../stage.js').StageKey): Promise<void> {
+    const projectId = await this.resolveProjectIdForIssue(id, 'prepareStage');
+    await this.resolveStateIdForStage(projectId, stage);
+  }
+
   async setStage(id: string, stage: import('../stage.js').StageKey): Promise<void> {
     const projectId = await this.resolveProjectIdForIssue(id, 'setStage');
     const stateId = await this.resolveStateIdForStage(projectId, stage);
+    if (await this.setStateViaApi(projectId, id, stateId)) return;
+    await this.setStateViaCli(projectId, id, stateId);
+  }
+
+  /**
+   * Bulk stage transitions (e.g. demoting several extra in-progress tickets at once).
+   *
+   * State ids are resolved once per (project, stage); with API credentials the PATCHes are
+   * dispatched concurrently (bounded), and any item the API rejects is retried via the CLI.
+   */
+  async setStages(changes: ReadonlyArray<{ id: string; stage: import('../stage.js').StageKey }>): Promise<void> {
+    const resolved: Array<{ id: string; projectId: string; stateId: string }> = [];
+    const stateIdByProjectStage = new Map<string, Promise<string>>();
+    for (const change of changes) {
+      const projectId = await this.resolveProjectIdForIssue(change.id, 'setStages');
+      const key = `${projectId}\u0000${change.stage}`;
+      let stateId = stateIdByProjectStage.get(key);
+      if (!stateId) {
+        stateId = this.resolveStateIdForStage(projectId, change.stage);
+        stateIdByProjectStage.set(key, stateId);
+      }
+      resolved.push({ id: change.id, projectId, stateId: await stateId });
+    }
+
+    const viaCli: typeof resolved = [];
+    if (this.api.hasCredentials()) {
+      let next = 0;
+      const worker = async (): Promise<void> => {
+        while (next < resolved.length) {
+          const item = resolved[next++]!;
+          if (!(await this.setStateViaApi(item.projectId, item.id, item.stateId))) viaCli.push(item);
+        }
+      };
+      await Promise.all(Array.from({ length: Math.min(PLANE_BULK_CONCURRENCY, resolved.length) }, worker));
+    } else {
+      viaCli.push(...resolved);
+    }
+
+    for (const item of viaCli) {
+      await this.setStateViaCli(item.projectId, item.id, item.stateId);
+    }
+  }
+
+  private async setStateViaApi(projectId: string, id: string, stateId: string): Promise<boolean> {
+    if (!this.api.hasCredentials()) return false;
+    const res = await this.sendWorkItemRequest(
+      projectId,
+      `${String(id)}/`,
+      { method: 'PATCH', body: { state: stateId } },
+      'Plane issues API',
+    ).catch(() => undefined);
+    if (res && isPlaneAuthFailure(res.status)) {
+      throw new PlaneApiError(`Plane issues API failed (update): HTTP ${res.status}`, res.status);
+    }
+    if (!res?.ok) return false;
+    this.invalidateSelectionCache(projectId);
+    return true;
+  }
+
+  private async setStateViaCli(projectId: string, id: string, stateId: string): Promise<void> {
     await this.cli.run([
       ...this.baseArgs,
       ...this.formatArgs,
@@ -2092,6 +2249,7 @@ export class PlaneAdapter implements Adapter {
       stateId,
       id,
     ]);
+    this.invalidateSelectionCache(projectId);
   }
 
   async addComment(id: string, body: string, opts?: { operationId?: string }): Promise<void> {
@@ -2196,15 +2354,15 @@ export class PlaneAdapter implements Adapter {
       id,
       me.id,
     ]);
+    this.invalidateSelectionCache(projectId);
 
     return { id, url: created?.url ? String(created.url) : undefined };
   }
 
   private async fetchSnapshotForProject(projectId: string, issuesRaw?: unknown): Promise<ReadonlyMap<string, WorkItem>> {
-    const out = JSON.stringify(
-      normalizePlaneIssuesList(
-        issuesRaw ?? ((await this.runJson(['issues', 'list', '-p', projectId])) ?? []),
-      ),
+    // Validate the already-decoded list directly (zod returns new objects; input is untouched).
+    const issuesList = normalizePlaneIssuesList(
+      issuesRaw ?? (await this.listProjectIssuesRaw(projectId)),
     );
 
     const StateSchema = z
@@ -2228,16 +2386,12 @@ export class PlaneAdapter implements Adapter {
         updatedAt: z.string().optional(),
         state: StateSchema.optional(),
         state_detail: StateSchema.optional(),
+        // Names are taken in one pass; the string branch isn't boxed into `{ name }` first.
         labels: z
-          .array(
-            z.union([
-              z.string().transform((name) => ({ name })),
-              z.object({ name: z.string() }).passthrough(),
-            ]),
-          )
+          .array(z.union([z.string(), z.object({ name: z.string() }).passthrough()]))
           .optional()
           .default([])
-          .transform((arr) => arr.map((x) => x.name)),
+          .transform((arr) => arr.map((x) => (typeof x === 'string' ? x : x.name))),
         assignees: z
           .array(
             z.union([
@@ -2306,7 +2460,7 @@ export class PlaneAdapter implements Adapter {
       .passthrough();
 
     const ParsedSchema = z.array(IssueSchema);
-    const issues = ParsedSchema.parse(JSON.parse(out || '[]'));
+    const issues = ParsedSchema.parse(issuesList);
 
     const items = new Map<string, WorkItem>();
 
@@ -2337,9 +2491,9 @@ export class PlaneAdapter implements Adapter {
         title,
         stage,
         url: issue.url,
-        labels: [...issue.labels],
+        labels: internLabels(issue.labels),
         assignees: issue.assignees,
-        updatedAt: updatedAtRaw ? new Date(updatedAtRaw) : undefined,
+        updatedAt: updatedAtRaw ? parsePlaneDate(updatedAtRaw) : undefined,
         raw: issue,
       });
     }
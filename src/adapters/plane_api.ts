@@ -0,0 +1,278 @@
+const DEFAULT_PLANE_BASE_URL = 'https://api.plane.so';
+const MAX_RATE_LIMIT_ATTEMPTS = 4;
+const MAX_RATE_LIMIT_WAIT_MS = 60_000;
+const DEFAULT_MAX_IN_FLIGHT = 10;
+
+export type PlaneApiRequest = {
+  method: 'GET' | 'POST' | 'PATCH' | 'DELETE';
+  /** JSON-serializable request body. */
+  body?: unknown;
+  /** Sent as If-None-Match (conditional GET). */
+  etag?: string;
+};
+
+/** A previously seen GET response body and the ETag it was served with. */
+export type PlaneConditionalEntry = {
+  etag: string;
+  body: unknown;
+};
+
+type PlaneApiCredentials = {
+  apiKey: string;
+  baseUrl: string;
+};
+
+/** Non-2xx Plane API response; `status` lets callers tell a rejected key from a flaky call. */
+export class PlaneApiError extends Error {
+  override name = 'PlaneApiError';
+  readonly status: number;
+
+  constructor(message: string, status: number) {
+    super(message);
+    this.status = status;
+  }
+}
+
+/**
+ * 401/403: the key itself is rejected. The CLI authenticates with the same key, so falling
+ * back to it would only hide the misconfiguration; callers surface these instead.
+ */
+export function isPlaneAuthFailure(status: number | undefined): boolean {
+  return status === 401 || status === 403;
+}
+
+function headerValue(res: Response, name: string): string | undefined {
+  const value = res.headers.get(name)?.trim();
+  return value ? value : undefined;
+}
+
+function resetAtMsFromHeader(raw: string | undefined, now: number): number | undefined {
+  if (!raw) return undefined;
+  const value = Number(raw);
+  if (!Number.isFinite(value) || value <= 0) return undefined;
+  // Plane reports a unix timestamp (seconds); tolerate millis and relative seconds too.
+  if (value > 1e12) return value;
+  if (value > 1e9) return value * 1000;
+  return now + value * 1000;
+}
+
+async function sleep(ms: number): Promise<void> {
+  await new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/**
+ * Process-wide gate for Plane API traffic.
+ *
+ * Plane's rate limit is per API key, not per adapter, so every client in the process
+ * should see the same X-RateLimit-Remaining / X-RateLimit-Reset state. The broker keeps
+ * that state, holds every caller (queued ones included) while an exhausted window or a
+ * 429's Retry-After runs out, and caps concurrent requests at min(maxInFlight, remaining).
+ */
+export class PlaneApiBroker {
+  private readonly maxInFlight: number;
+  private inFlight = 0;
+  private readonly waiters: Array<() => void> = [];
+  private rateLimitRemaining?: number;
+  /** While set, the window is closed: nobody is dispatched before this time. */
+  private resumeAtMs?: number;
+
+  constructor(opts?: { maxInFlight?: number }) {
+    this.maxInFlight = Math.max(1, opts?.maxInFlight ?? DEFAULT_MAX_IN_FLIGHT);
+  }
+
+  private capacity(): number {
+    if (this.resumeAtMs != null) return 0;
+    const remaining = this.rateLimitRemaining;
+    return remaining != null && remaining > 0 ? Math.min(this.maxInFlight, remaining) : this.maxInFlight;
+  }
+
+  /** Close the shared window for `ms` (e.g. a 429's Retry-After); never shortens a longer pause. */
+  pauseFor(ms: number): void {
+    const resumeAtMs = Date.now() + Math.min(Math.max(0, ms), MAX_RATE_LIMIT_WAIT_MS);
+    if (this.resumeAtMs == null || resumeAtMs > this.resumeAtMs) this.resumeAtMs = resumeAtMs;
+  }
+
+  private async waitForRateLimitWindow(): Promise<void> {
+    while (this.resumeAtMs != null) {
+      const waitMs = this.resumeAtMs - Date.now();
+      if (waitMs <= 0) {
+        // Reopened: the exhausted count is stale until the next response reports a fresh one.
+        this.resumeAtMs = undefined;
+        this.rateLimitRemaining = undefined;
+        return;
+      }
+      await sleep(waitMs);
+    }
+  }
+
+  private async acquire(): Promise<void> {
+    // Re-check the window after every wake-up: it may have closed while this caller queued.
+    for (;;) {
+      await this.waitForRateLimitWindow();
+      if (this.inFlight < this.capacity()) {
+        this.inFlight += 1;
+        return;
+      }
+      await new Promise<void>((resolve) => this.waiters.push(resolve));
+    }
+  }
+
+  private release(): void {
+    this.inFlight -= 1;
+    this.waiters.shift()?.();
+  }
+
+  private recordRateLimit(res: Response): void {
+    const remainingRaw = headerValue(res, 'x-ratelimit-remaining');
+    if (remainingRaw == null) return;
+
+    const remaining = Number(remainingRaw);
+    if (!Number.isFinite(remaining)) return;
+    this.rateLimitRemaining = remaining;
+    if (remaining > 0) return;
+
+    const now = Date.now();
+    const resetAtMs = resetAtMsFromHeader(headerValue(res, 'x-ratelimit-reset'), now);
+    if (resetAtMs != null) this.pauseFor(resetAtMs - now);
+  }
+
+  /** Run one HTTP exchange once the rate-limit window and a concurrency slot allow it. */
+  async execute(send: () => Promise<Response>): Promise<Response> {
+    await this.acquire();
+    try {
+      const res = await send();
+      this.recordRateLimit(res);
+      return res;
+    } finally {
+      this.release();
+    }
+  }
+}
+
+const defaultPlaneApiBroker = new PlaneApiBroker();
+
+/**
+ * Thin Plane REST client shared by all API calls of one adapter instance.
+ *
+ * - Credentials (PLANE_API_KEY / PLANE_BASE_URL) are resolved once and reused.
+ * - Requests go through Node's global fetch, whose dispatcher keeps a keep-alive
+ *   connection pool per origin, so consecutive calls skip the CLI process spawn and
+ *   the fresh TCP/TLS handshake.
+ * - Dispatch goes through a {@link PlaneApiBroker} (process-wide by default), which
+ *   tracks X-RateLimit-Remaining / X-RateLimit-Reset across clients; 429s are retried
+ *   here after their Retry-After closes the broker's shared window.
+ */
+export class PlaneApiClient {
+  private readonly workspaceSlug: string;
+  private readonly apiKeyOverride?: string;
+  private readonly baseUrlOverride?: string;
+  private readonly broker: PlaneApiBroker;
+  private credentials?: PlaneApiCredentials;
+  private readonly conditionalByUrl = new Map<string, PlaneConditionalEntry>();
+
+  constructor(opts: { workspaceSlug: string; apiKey?: string; baseUrl?: string; broker?: PlaneApiBroker }) {
+    this.workspaceSlug = opts.workspaceSlug;
+    this.apiKeyOverride = opts.apiKey;
+    this.baseUrlOverride = opts.baseUrl;
+    this.broker = opts.broker ?? defaultPlaneApiBroker;
+  }
+
+  private resolveCredentials(): PlaneApiCredentials | undefined {
+    if (this.credentials) return this.credentials;
+
+    // Resolved lazily: the CLI may load PLANE_API_KEY from its env helper after construction.
+    const apiKey = String(this.apiKeyOverride ?? process.env.PLANE_API_KEY ?? '').trim();
+    if (!apiKey) return undefined;
+
+    const baseUrl = (this.baseUrlOverride || process.env.PLANE_BASE_URL || DEFAULT_PLANE_BASE_URL).replace(/\/$/, '');
+    this.credentials = { apiKey, baseUrl };
+    return this.credentials;
+  }
+
+  hasCredentials(): boolean {
+    return this.resolveCredentials() !== undefined;
+  }
+
+  requireCredentials(what: string): PlaneApiCredentials {
+    const credentials = this.resolveCredentials();
+    if (!credentials) {
+      throw new Error(`PLANE_API_KEY is required for ${what}`);
+    }
+    return credentials;
+  }
+
+  /** Absolute URL below /workspaces/<slug>/projects/<projectId>/. */
+  projectUrl(projectId: string, suffix: string, what: string): string {
+    const { baseUrl } = this.requireCredentials(what);
+    return `${baseUrl}/api/v1/workspaces/${this.workspaceSlug}/projects/${projectId}/${suffix}`;
+  }
+
+  /**
+   * Send one request and return the raw Response (callers decide how to surface !ok).
+   * Only 429s are retried here; everything else is returned as-is.
+   */
+  async request(url: string, req: PlaneApiRequest, what: string): Promise<Response> {
+    const { apiKey } = this.requireCredentials(what);
+    const init: RequestInit = req.body === undefined
+      ? {
+          method: req.method,
+          headers: req.etag
+            ? { 'x-api-key': apiKey, 'If-None-Match': req.etag }
+            : { 'x-api-key': apiKey },
+        }
+      : {
+          method: req.method,
+          headers: {
+            'Content-Type': 'application/json',
+            'x-api-key': apiKey,
+          },
+          body: JSON.stringify(req.body),
+        };
+
+    let attempt = 0;
+    while (true) {
+      attempt += 1;
+      const res = await this.broker.execute(() => fetch(url, init));
+
+      if (res.status !== 429 || attempt >= MAX_RATE_LIMIT_ATTEMPTS) return res;
+
+      // The limit is per key, so the backoff closes the shared window for every caller;
+      // the retry then queues in the broker like everyone else.
+      const retryAfterSeconds = Number(headerValue(res, 'retry-after'));
+      this.broker.pauseFor(
+        Number.isFinite(retryAfterSeconds) && retryAfterSeconds > 0 ? retryAfterSeconds * 1000 : attempt * 1500,
+      );
+    }
+  }
+
+  /** ETag + body last seen for a URL (for persisting next to on-disk caches). */
+  conditionalEntry(url: string): PlaneConditionalEntry | undefined {
+    return this.conditionalByUrl.get(url);
+  }
+
+  /** Seed a URL's conditional-GET state, e.g. from an on-disk cache written by an earlier run. */
+  rememberConditional(url: string, entry: PlaneConditionalEntry): void {
+    if (entry.etag) this.conditionalByUrl.set(url, entry);
+  }
+
+  /**
+   * GET a JSON document, sending If-None-Match when the URL was seen before.
+   * A 304 returns the remembered body without transferring or parsing the payload again.
+   */
+  async getJson(url: string, what: string): Promise<unknown> {
+    const known = this.conditionalByUrl.get(url);
+    const res = await this.request(url, { method: 'GET', etag: known?.etag }, what);
+
+    if (res.status === 304 && known) return known.body;
+    if (!res.ok) {
+      const txt = await res.text().catch(() => '');
+      throw new PlaneApiError(`${what} failed: HTTP ${res.status} ${txt}`, res.status);
+    }
+
+    const body = await res.json().catch(() => null);
+    const etag = headerValue(res, 'etag');
+    if (etag) this.conditionalByUrl.set(url, { etag, body });
+    else this.conditionalByUrl.delete(url);
+    return body;
+  }
+}
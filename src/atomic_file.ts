@@ -0,0 +1,26 @@
+import * as fs from 'node:fs/promises';
+import * as path from 'node:path';
+
+/**
+ * Write a file by writing a temp file next to it and renaming it into place, so a crash
+ * mid-write can't leave a truncated file behind.
+ *
+ * `skipIfUnchanged` first compares against the file on disk (not a remembered copy: hooks and
+ * cron ticks write the same files) and skips the write when it already holds `content`. Only
+ * worth it for small files whose content is usually unchanged between saves.
+ */
+export async function writeFileAtomic(
+  filePath: string,
+  content: string,
+  opts?: { skipIfUnchanged?: boolean },
+): Promise<void> {
+  if (opts?.skipIfUnchanged) {
+    const existing = await fs.readFile(filePath, 'utf8').catch(() => undefined);
+    if (existing === content) return;
+  }
+
+  await fs.mkdir(path.dirname(filePath), { recursive: true });
+  const tempPath = `${filePath}.${process.pid}.${Date.now()}.tmp`;
+  await fs.writeFile(tempPath, content, 'utf8');
+  await fs.rename(tempPath, filePath);
+}
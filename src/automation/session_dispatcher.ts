@@ -2,6 +2,7 @@ import * as fs from 'node:fs/promises';
 import * as fsSync from 'node:fs';
 import * as path from 'node:path';
 import { fileURLToPath } from 'node:url';
+import { writeFileAtomic } from '../atomic_file.js';
 import { WORKER_RESULT_JSON_SCHEMA_CONTRACT } from '../workflow/worker_result.js';
 
 export const DEFAULT_SESSION_MAP_PATH = '.tmp/kwf-session-map.json';
@@ -277,7 +278,8 @@ export async function loadSessionMap(path = DEFAULT_SESSION_MAP_PATH): Promise<S
 
 export async function saveSessionMap(map: SessionMap, path = DEFAULT_SESSION_MAP_PATH): Promise<void> {
   await fs.mkdir('.tmp', { recursive: true });
-  await fs.writeFile(path, `${JSON.stringify(map, null, 2)}\n`, 'utf8');
+  // persistMap runs several times per tick, usually with nothing changed.
+  await writeFileAtomic(path, `${JSON.stringify(map, null, 2)}\n`, { skipIfUnchanged: true });
 }
 
 function sanitizeSessionToken(raw: string): string {
@@ -83,6 +83,8 @@ export type WorkItemReadPort = {
 
 export type WorkItemWritePort = {
   setStage(id: string, stage: StageKey): Promise<void>;
+  /** Resolve what setStage(id, stage) needs without changing the item, so it can overlap other calls. */
+  prepareStage?(id: string, stage: StageKey): Promise<void>;
   addComment(id: string, body: string, opts?: { operationId?: string }): Promise<void>;
   hasCommentOperation?(id: string, operationId: string): Promise<boolean>;
   hasLinkUrl?(id: string, url: string): Promise<boolean>;
@@ -1,6 +1,16 @@
 import type { Event } from './events.js';
 import type { WorkItem } from './models.js';
 
+/** Order-sensitive label equality without copying or joining (the common case is "unchanged"). */
+function sameLabels(a: readonly string[], b: readonly string[]): boolean {
+  if (a === b) return true;
+  if (a.length !== b.length) return false;
+  for (let i = 0; i < a.length; i += 1) {
+    if (a[i] !== b[i]) return false;
+  }
+  return true;
+}
+
 export function diffWorkItems(
   previous: ReadonlyMap<string, WorkItem> | Readonly<Record<string, WorkItem>>,
   current: ReadonlyMap<string, WorkItem> | Readonly<Record<string, WorkItem>>,
@@ -8,31 +18,21 @@ export function diffWorkItems(
   const prevMap = previous instanceof Map ? previous : new Map(Object.entries(previous));
   const currMap = current instanceof Map ? current : new Map(Object.entries(current));
 
-  const events: Event[] = [];
-
-  const prevIds = new Set(prevMap.keys());
-  const currIds = new Set(currMap.keys());
+  // Deletions, then creations, then stage changes/updates interleaved in previous-snapshot
+  // order. One pass over each snapshot fills these buckets, so every item is looked up once.
+  const deleted: Event[] = [];
+  const created: Event[] = [];
+  const changedOrUpdated: Event[] = [];
 
-  const deleted = [...prevIds].filter((id) => !currIds.has(id)).sort();
-  for (const wid of deleted) {
-    events.push({ type: 'WorkItemDeleted', workItemId: wid });
-  }
-
-  const created = [...currIds].filter((id) => !prevIds.has(id)).sort();
-  for (const wid of created) {
-    const workItem = currMap.get(wid);
-    if (!workItem) continue;
-    events.push({ type: 'WorkItemCreated', workItem });
-  }
-
-  const common = [...prevIds].filter((id) => currIds.has(id)).sort();
-  for (const wid of common) {
-    const prev = prevMap.get(wid);
+  for (const [wid, prev] of prevMap) {
     const curr = currMap.get(wid);
-    if (!prev || !curr) continue;
+    if (!curr) {
+      deleted.push({ type: 'WorkItemDeleted', workItemId: wid });
+      continue;
+    }
 
     if (prev.stage.key !== curr.stage.key) {
-      events.push({
+      changedOrUpdated.push({
         type: 'StageChanged',
         workItemId: wid,
         old: { key: prev.stage.key },
@@ -41,13 +41,21 @@ export function diffWorkItems(
       continue;
     }
 
-    const prevLabels = [...prev.labels];
-    const currLabels = [...curr.labels];
+    if (prev.title !== curr.title || !sameLabels(prev.labels, curr.labels)) {
+      changedOrUpdated.push({ type: 'WorkItemUpdated', workItemId: wid });
+    }
+  }
 
-    if (prev.title !== curr.title || prevLabels.join('\u0000') !== currLabels.join('\u0000')) {
-      events.push({ type: 'WorkItemUpdated', workItemId: wid });
+  // Only a size mismatch or a deletion can leave room for new ids.
+  if (currMap.size !== prevMap.size - deleted.length) {
+    for (const [wid, workItem] of currMap) {
+      if (!prevMap.has(wid)) created.push({ type: 'WorkItemCreated', workItem });
     }
   }
 
+  const events = deleted;
+  for (const bucket of [created, changedOrUpdated]) {
+    for (const event of bucket) events.push(event);
+  }
   return events;
 }
@@ -22,7 +22,8 @@ export async function tick(
   const prev = previousSnapshot ?? new Map<string, WorkItem>();
 
   const fetched = await adapter.fetchSnapshot();
-  const snapshot = fetched instanceof Map ? new Map(fetched) : new Map(Object.entries(fetched));
+  // Adapters hand back a fresh read-only map per poll; only plain records need converting.
+  const snapshot: ReadonlyMap<string, WorkItem> = fetched instanceof Map ? fetched : new Map(Object.entries(fetched));
 
   const events = diffWorkItems(prev, snapshot);
 
@@ -10,17 +10,27 @@ export const CANONICAL_STAGE_KEYS = [
 export const StageKeySchema = z.enum(CANONICAL_STAGE_KEYS);
 export type StageKey = z.infer<typeof StageKeySchema>;
 
+const SLUG_SEPARATORS = /[ _-]+/g;
+
+// fromAny sees a handful of distinct spellings (Plane state names, labels, CLI args), so
+// resolved inputs are memoized. Bounded so arbitrary caller input can't grow it forever.
+const FROM_ANY_CACHE_MAX = 64;
+const fromAnyCache = new Map<string, Stage>();
+
 function slug(input: string): string {
-  return input
-    .trim()
-    .toLowerCase()
-    .replace(/^stage[:/]/, '')
-    .replaceAll('_', '-')
-    .replaceAll(' ', '-')
-    .replaceAll(/-+/g, '-');
+  let t = input.trim().toLowerCase();
+  if (t.startsWith('stage:') || t.startsWith('stage/')) t = t.slice(6);
+  // One pass maps `_`/space to `-` and collapses runs.
+  return t.replace(SLUG_SEPARATORS, '-');
 }
 
 export class Stage {
+  /** Shared frozen instances, one per canonical key (compare with `===` or by `.key`). */
+  static readonly TODO: Stage = Object.freeze(new Stage('stage:todo'));
+  static readonly BLOCKED: Stage = Object.freeze(new Stage('stage:blocked'));
+  static readonly IN_PROGRESS: Stage = Object.freeze(new Stage('stage:in-progress'));
+  static readonly IN_REVIEW: Stage = Object.freeze(new Stage('stage:in-review'));
+
   readonly key: StageKey;
 
   constructor(key: StageKey) {
@@ -28,23 +38,23 @@ export class Stage {
   }
 
   static fromAny(value: string): Stage {
-    const trimmed = value.trim();
-    const lower = trimmed.toLowerCase();
+    const known = STAGE_ALIASES.get(value) ?? fromAnyCache.get(value);
+    if (known) return known;
 
-    let normalized = slug(trimmed);
+    let normalized = slug(value);
     // Backward-compat alias: old canonical stage key was stage:backlog.
     if (normalized === 'backlog') normalized = 'todo';
 
-    const key = lower.startsWith('stage:') || lower.startsWith('stage/')
-      ? (`stage:${normalized}` as const)
-      : (`stage:${normalized}` as const);
-
-    const parsed = StageKeySchema.safeParse(key);
-    if (!parsed.success) {
+    const stage = STAGE_BY_KEY.get(`stage:${normalized}`);
+    if (!stage) {
       throw new Error(`Unknown stage: ${JSON.stringify(value)}`);
     }
 
-    return new Stage(parsed.data);
+    if (fromAnyCache.size >= FROM_ANY_CACHE_MAX) {
+      fromAnyCache.delete(fromAnyCache.keys().next().value!);
+    }
+    fromAnyCache.set(value, stage);
+    return stage;
   }
 
   toString(): string {
@@ -52,6 +62,34 @@ export class Stage {
   }
 }
 
+const STAGE_BY_KEY: ReadonlyMap<string, Stage> = new Map(
+  [Stage.TODO, Stage.BLOCKED, Stage.IN_PROGRESS, Stage.IN_REVIEW].map((stage) => [stage.key, stage] as const),
+);
+
+/** Pre-built spellings (canonical, `stage/`, bare, snake_case, spaced, Title Case) -> instance. */
+const STAGE_ALIASES: ReadonlyMap<string, Stage> = (() => {
+  const aliases = new Map<string, Stage>();
+  const add = (bare: string, stage: Stage): void => {
+    const words = bare.split('-');
+    const spaced = words.join(' ');
+    for (const spelling of [
+      `stage:${bare}`,
+      `stage/${bare}`,
+      bare,
+      words.join('_'),
+      spaced,
+      words.map((w) => w.charAt(0).toUpperCase() + w.slice(1)).join(' '),
+      spaced.toUpperCase(),
+    ]) {
+      aliases.set(spelling, stage);
+    }
+  };
+  for (const stage of STAGE_BY_KEY.values()) add(stage.key.slice('stage:'.length), stage);
+  // Backward-compat alias: old canonical stage key was stage:backlog.
+  add('backlog', Stage.TODO);
+  return aliases;
+})();
+
 export const StageSchema = z
   .object({
     key: StageKeySchema,
@@ -50,16 +50,28 @@ export async function update(adapter: VerbAdapter, id: string, text: string): Pr
   await adapter.addComment(id, text);
 }
 
+/**
+ * Post `comment`, then move the item to `stage`. A failed comment must not leave the ticket
+ * moved with no explanation, so only the adapter's read-only stage lookups overlap the
+ * comment; the move itself waits for it.
+ */
+async function commentThenSetStage(adapter: VerbAdapter, id: string, comment: string, stage: StageKey): Promise<void> {
+  await Promise.all([
+    adapter.addComment(id, comment),
+    // Best-effort warm-up: setStage resolves again and reports any real failure.
+    adapter.prepareStage?.(id, stage).catch(() => undefined),
+  ]);
+  await adapter.setStage(id, stage);
+}
+
 export async function ask(adapter: VerbAdapter, id: string, text: string): Promise<void> {
   if (!text.trim()) throw new Error('ask requires non-empty text');
-  await adapter.addComment(id, text);
-  await adapter.setStage(id, 'stage:blocked');
+  await commentThenSetStage(adapter, id, text, 'stage:blocked');
 }
 
 export async function complete(adapter: VerbAdapter, id: string, summary: string): Promise<void> {
   if (!summary.trim()) throw new Error('complete requires non-empty summary');
-  await adapter.addComment(id, `Completed: ${summary}`);
-  await adapter.setStage(id, 'stage:in-review');
+  await commentThenSetStage(adapter, id, `Completed: ${summary}`, 'stage:in-review');
 }
 
 export async function create(adapter: VerbAdapter, input: CreateInput): Promise<{ id: string; url?: string }> {
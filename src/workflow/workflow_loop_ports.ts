@@ -75,6 +75,8 @@ export type WorkflowLoopSelectionAdapter = {
   listAttachments(id: string): Promise<Array<unknown>>;
   listLinkedWorkItems(id: string): Promise<Array<unknown>>;
   setStage(id: string, stage: StageKey): Promise<void>;
+  /** Optional bulk variant; adapters that can batch transitions avoid N sequential round trips. */
+  setStages?(changes: ReadonlyArray<{ id: string; stage: StageKey }>): Promise<void>;
 };
 
 export type WorkflowLoopControllerAdapter = WorkflowLifecycleAdapter & WorkflowHousekeepingAdapter;
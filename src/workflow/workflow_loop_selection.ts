@@ -165,8 +165,13 @@ export async function runWorkflowLoopSelection(params: {
     }
 
     if (!params.dryRun) {
-      for (const extra of ownInProgress.slice(1)) {
-        await params.adapter.setStage(extra.id, 'stage:todo');
+      const extras = ownInProgress.slice(1);
+      if (extras.length > 1 && params.adapter.setStages) {
+        await params.adapter.setStages(extras.map((extra) => ({ id: extra.id, stage: 'stage:todo' as const })));
+      } else {
+        for (const extra of extras) {
+          await params.adapter.setStage(extra.id, 'stage:todo');
+        }
       }
     }
     return {
@@ -0,0 +1,76 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+vi.mock('execa', () => {
+  return {
+    execa: vi.fn()
+  };
+});
+
+import { execa } from 'execa';
+import { CliError, CliRunner } from '../src/adapters/cli.js';
+
+type ExecaMock = typeof execa & {
+  mockResolvedValueOnce: (value: unknown) => ExecaMock;
+  mockRejectedValueOnce: (value: unknown) => ExecaMock;
+  mockReset: () => void;
+};
+
+describe('CliRunner', () => {
+  beforeEach(() => {
+    (execa as any as ExecaMock).mockReset();
+  });
+
+  it('retries rate-limited commands with backoff', async () => {
+    (execa as any as ExecaMock)
+      .mockRejectedValueOnce(
+        Object.assign(new Error('Command failed with exit code 1'), {
+          stderr: 'API Error 429: {"error_code":5900,"error_message":"RATE_LIMIT_EXCEEDED"}',
+        }),
+      )
+      .mockResolvedValueOnce({ stdout: '{"ok":true}' });
+
+    const cli = new CliRunner('plane', { rateLimitRetries: 2, backoffBaseMs: 1 });
+
+    await expect(cli.run(['me'])).resolves.toBe('{"ok":true}');
+    expect((execa as any).mock.calls.length).toBe(2);
+  });
+
+  it('gives up after the configured number of rate-limit retries', async () => {
+    const rateLimited = Object.assign(new Error('Command failed'), { stderr: 'API rate limit exceeded' });
+    (execa as any as ExecaMock)
+      .mockRejectedValueOnce(rateLimited)
+      .mockRejectedValueOnce(rateLimited);
+
+    const cli = new CliRunner('plane', { rateLimitRetries: 1, backoffBaseMs: 1 });
+
+    await expect(cli.run(['me'])).rejects.toThrow(CliError);
+    expect((execa as any).mock.calls.length).toBe(2);
+  });
+
+  it('does not retry other failures', async () => {
+    (execa as any as ExecaMock).mockRejectedValueOnce(
+      Object.assign(new Error('Command failed'), { stderr: 'issue 429 not found' }),
+    );
+
+    const cli = new CliRunner('plane', { rateLimitRetries: 3, backoffBaseMs: 1 });
+
+    await expect(cli.run(['issues', 'get', '-p', 'proj', '429'])).rejects.toThrow(/not found/);
+    expect((execa as any).mock.calls.length).toBe(1);
+  });
+
+  it('ignores rate-limit wording that only appears in the command line', async () => {
+    (execa as any as ExecaMock).mockRejectedValueOnce(
+      Object.assign(new Error('Command timed out: plane issues comment add -p proj i1 "we hit the rate limit"'), {
+        timedOut: true,
+        stderr: '',
+      }),
+    );
+
+    const cli = new CliRunner('plane', { rateLimitRetries: 3, backoffBaseMs: 1 });
+
+    await expect(cli.run(['issues', 'comment', 'add', '-p', 'proj', 'i1', 'we hit the rate limit'])).rejects.toThrow(
+      CliError,
+    );
+    expect((execa as any).mock.calls.length).toBe(1);
+  });
+});
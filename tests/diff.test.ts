@@ -5,7 +5,7 @@ import { Stage } from '../src/stage.js';
 import type { WorkItem } from '../src/models.js';
 
 describe('diffWorkItems', () => {
-  it('emits deleted, created, stage changed, then updated in sorted id order', () => {
+  it('emits deleted, created, stage changed, then updated in snapshot order', () => {
     const prev: Record<string, WorkItem> = {
       a: { id: 'a', title: 'A', stage: Stage.fromAny('backlog'), labels: [], raw: {} },
       b: { id: 'b', title: 'B', stage: Stage.fromAny('backlog'), labels: [], raw: {} },
@@ -32,4 +32,47 @@ describe('diffWorkItems', () => {
       { type: 'WorkItemUpdated', workItemId: 'd' },
     ]);
   });
+
+  it('emits updated only when labels actually differ', () => {
+    const stage = Stage.fromAny('backlog');
+    const prev: Record<string, WorkItem> = {
+      same: { id: 'same', title: 'S', stage, labels: ['x', 'y'], raw: {} },
+      relabeled: { id: 'relabeled', title: 'R', stage, labels: ['x'], raw: {} },
+    };
+    const curr: Record<string, WorkItem> = {
+      same: { id: 'same', title: 'S', stage, labels: ['x', 'y'], raw: {} },
+      relabeled: { id: 'relabeled', title: 'R', stage, labels: ['x', 'z'], raw: {} },
+    };
+
+    expect(diffWorkItems(prev, curr)).toEqual([{ type: 'WorkItemUpdated', workItemId: 'relabeled' }]);
+  });
+
+  it('detects a created item that replaces a deleted one in an equal-size snapshot', () => {
+    const stage = Stage.fromAny('backlog');
+    const prev = new Map<string, WorkItem>([['a', { id: 'a', title: 'A', stage, labels: [], raw: {} }]]);
+    const curr = new Map<string, WorkItem>([['b', { id: 'b', title: 'B', stage, labels: [], raw: {} }]]);
+
+    expect(diffWorkItems(prev, curr)).toEqual([
+      { type: 'WorkItemDeleted', workItemId: 'a' },
+      { type: 'WorkItemCreated', workItem: curr.get('b') },
+    ]);
+    expect(diffWorkItems(prev, new Map(prev))).toEqual([]);
+  });
+
+  it('keeps stage changes and updates in previous-snapshot order', () => {
+    const todo = Stage.fromAny('backlog');
+    const prev = new Map<string, WorkItem>([
+      ['u', { id: 'u', title: 'U', stage: todo, labels: [], raw: {} }],
+      ['s', { id: 's', title: 'S', stage: todo, labels: [], raw: {} }],
+    ]);
+    const curr = new Map<string, WorkItem>([
+      ['u', { id: 'u', title: 'U2', stage: todo, labels: [], raw: {} }],
+      ['s', { id: 's', title: 'S', stage: Stage.fromAny('blocked'), labels: [], raw: {} }],
+    ]);
+
+    expect(diffWorkItems(prev, curr)).toEqual([
+      { type: 'WorkItemUpdated', workItemId: 'u' },
+      { type: 'StageChanged', workItemId: 's', old: { key: 'stage:todo' }, new: { key: 'stage:blocked' } },
+    ]);
+  });
 });
@@ -131,6 +131,60 @@ describe('PlaneAdapter', () => {
     expect(snap.get('i2')?.labels).toEqual(['bug', 'stage:todo']);
   });
 
+  it('parses snapshot updated_at and drops unparseable timestamps', async () => {
+    const issues = [
+      { id: 'd1', name: 'Dated', state: { name: 'stage:todo' }, updated_at: '2026-02-26T08:31:00Z' },
+      { id: 'd2', name: 'Same time', state: { name: 'stage:todo' }, updated_at: '2026-02-26T08:31:00Z' },
+      { id: 'd3', name: 'Garbled', state: { name: 'stage:todo' }, updated_at: 'not-a-date' },
+    ];
+    (execa as any as ExecaMock).mockResolvedValueOnce({ stdout: JSON.stringify(issues) });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      bin: 'plane',
+      stageMap: { 'stage:todo': 'stage:todo' },
+    });
+
+    const snap = await adapter.fetchSnapshot();
+
+    expect(snap.get('d1')?.updatedAt?.toISOString()).toBe('2026-02-26T08:31:00.000Z');
+    // Memoized per string, but each item still gets its own (mutable) Date.
+    expect(snap.get('d2')?.updatedAt).toEqual(snap.get('d1')?.updatedAt);
+    expect(snap.get('d2')?.updatedAt).not.toBe(snap.get('d1')?.updatedAt);
+    expect(snap.has('d3')).toBe(true);
+    expect(snap.get('d3')?.updatedAt).toBeUndefined();
+  });
+
+  it('shares one label array across items with the same label set', async () => {
+    const issues = [
+      { id: 'i1', name: 'One', state: { name: 'stage:todo' }, labels: [{ name: 'bug' }, { name: 'ui' }] },
+      { id: 'i2', name: 'Two', state: { name: 'stage:todo' }, labels: ['bug', 'ui'] },
+      { id: 'i3', name: 'Three', state: { name: 'stage:todo' }, labels: ['ui', 'bug'] },
+      { id: 'i4', name: 'Four', state: { name: 'stage:todo' }, labels: ['bug\u0000ui'] },
+    ];
+    (execa as any as ExecaMock)
+      .mockResolvedValueOnce({ stdout: JSON.stringify(issues) })
+      .mockResolvedValueOnce({ stdout: JSON.stringify(issues) });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      bin: 'plane',
+      stageMap: { 'stage:todo': 'stage:todo' },
+    });
+
+    const first = await adapter.fetchSnapshot();
+    const second = await adapter.fetchSnapshot();
+
+    expect(first.get('i1')?.labels).toEqual(['bug', 'ui']);
+    expect(first.get('i2')?.labels).toBe(first.get('i1')?.labels);
+    expect(first.get('i3')?.labels).toEqual(['ui', 'bug']);
+    expect(first.get('i3')?.labels).not.toBe(first.get('i1')?.labels);
+    expect(second.get('i1')?.labels).toBe(first.get('i1')?.labels);
+    expect(first.get('i4')?.labels).toEqual(['bug\u0000ui']);
+  });
+
   it('supports mapping non-canonical Plane state names via stageMap', async () => {
     (execa as any as ExecaMock).mockResolvedValueOnce({
       stdout: JSON.stringify([
@@ -295,6 +349,7 @@ describe('PlaneAdapter', () => {
 
     const fetchMock = vi.fn(async () => ({
       ok: true,
+      headers: new Headers(),
       json: async () => ({
         results: [
           {
@@ -340,7 +395,7 @@ describe('PlaneAdapter', () => {
 
     expect(ids).toEqual(['todo-mine']);
     expect(fetchMock).toHaveBeenCalledWith(
-      `https://plane.example/api/v1/workspaces/ws/projects/${projectId}/issues/`,
+      `https://plane.example/api/v1/workspaces/ws/projects/${projectId}/issues/?state=state-todo-1&assignees=me-1`,
       expect.objectContaining({
         method: 'GET',
         headers: { 'x-api-key': 'test-key' },
@@ -361,12 +416,176 @@ describe('PlaneAdapter', () => {
     ]);
   });
 
+  it('follows Plane API cursors so snapshots include every page', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const page = (ids: string[], extra: Record<string, unknown> = {}) => ({
+      ok: true,
+      status: 200,
+      headers: new Headers(),
+      json: async () => ({ results: ids.map((id) => ({ id, name: id, state: { name: 'Todo' } })), ...extra }),
+      text: async () => '',
+    });
+    const fetchMock = vi.fn(async (url: string) => {
+      const cursor = new URL(url).searchParams.get('cursor');
+      if (cursor === '2:1:0') return page(['p3'], { next_cursor: '2:2:0', next_page_results: false });
+      return page(['p1', 'p2'], { next_cursor: '2:1:0', next_page_results: true });
+    });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      stageMap: { Todo: 'stage:todo' },
+    });
+
+    const snap = await adapter.fetchSnapshot();
+
+    expect(Array.from(snap.keys())).toEqual(['p1', 'p2', 'p3']);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock.mock.calls[1]?.[0]).toBe(
+      'https://plane.example/api/v1/workspaces/ws/projects/proj/issues/?cursor=2%3A1%3A0',
+    );
+  });
+
+  it('fetches remaining Plane API issue pages concurrently', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const page = (ids: string[], extra: Record<string, unknown> = {}) => ({
+      ok: true,
+      status: 200,
+      headers: new Headers(),
+      json: async () => ({
+        results: ids.map((id) => ({ id, name: id, state: 'state-todo-1', assignees: ['me-1'] })),
+        ...extra,
+      }),
+      text: async () => '',
+    });
+    const fetchMock = vi.fn(async (url: string) => {
+      const cursor = new URL(url).searchParams.get('cursor');
+      if (cursor === '2:1:0') return page(['t3', 't4']);
+      if (cursor === '2:2:0') return page(['t5']);
+      return page(['t1', 't2'], { next_cursor: '2:1:0', next_page_results: true, total_pages: 3 });
+    });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const projectId = `proj-api-pages-${Date.now()}`;
+    (execa as any as ExecaMock)
+      .mockResolvedValueOnce({
+        stdout: JSON.stringify({ id: 'me-1', email: 'me@example.com', display_name: 'Me' }),
+      })
+      .mockResolvedValueOnce({
+        stdout: JSON.stringify({
+          results: [{ id: 'state-todo-1', name: 'Todo' }],
+        }),
+      });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId,
+      stageMap: {
+        Todo: 'stage:todo',
+      },
+    });
+
+    const ids = await adapter.listBacklogIdsInOrder();
+
+    expect([...ids].sort()).toEqual(['t1', 't2', 't3', 't4', 't5']);
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('falls back to the CLI when a Plane API issue list exceeds the page cap', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const fetchMock = vi.fn(async () => ({
+      ok: true,
+      status: 200,
+      headers: new Headers(),
+      json: async () => ({
+        results: [{ id: 'api-1', name: 'api-1', state: { name: 'Todo' } }],
+        next_cursor: '1:1:0',
+        next_page_results: true,
+        total_pages: 51,
+      }),
+      text: async () => '',
+    }));
+    vi.stubGlobal('fetch', fetchMock);
+
+    (execa as any as ExecaMock).mockResolvedValueOnce({
+      stdout: JSON.stringify([{ id: 'cli-1', name: 'cli-1', state: { name: 'Todo' } }]),
+    });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      stageMap: { Todo: 'stage:todo' },
+    });
+
+    const snap = await adapter.fetchSnapshot();
+
+    expect(Array.from(snap.keys())).toEqual(['cli-1']);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect((execa as any).mock.calls.map((c: any) => c[1])).toEqual([
+      ['-f', 'json', 'issues', 'list', '-p', 'proj'],
+    ]);
+  });
+
+  it('reuses selection listings briefly and drops them after a stage change', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const fetchMock = vi.fn(async (_url: string, init?: any) => ({
+      ok: true,
+      status: 200,
+      headers: new Headers(),
+      json: async () => (init?.method === 'GET'
+        ? { results: [{ id: 'todo-1', name: 'One', state: 'state-todo-1', assignees: ['me-1'] }] }
+        : {}),
+      text: async () => '',
+    }));
+    vi.stubGlobal('fetch', fetchMock);
+
+    const projectId = `proj-selection-ttl-${Date.now()}`;
+    (execa as any).mockImplementation(async (_bin: string, args: string[]) => ({
+      stdout: args.includes('me')
+        ? JSON.stringify({ id: 'me-1', email: 'me@example.com', display_name: 'Me' })
+        : JSON.stringify({
+            results: [
+              { id: 'state-todo-1', name: 'Todo' },
+              { id: 'state-doing-1', name: 'Doing' },
+            ],
+          }),
+    }));
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId,
+      stageMap: {
+        Todo: 'stage:todo',
+        Doing: 'stage:in-progress',
+      },
+    });
+
+    expect(await adapter.listBacklogIdsInOrder()).toEqual(['todo-1']);
+    expect(await adapter.listBacklogIdsInOrder()).toEqual(['todo-1']);
+    const listCalls = () => fetchMock.mock.calls.filter((c: any[]) => c[1]?.method === 'GET').length;
+    expect(listCalls()).toBe(1);
+
+    await adapter.setStage('todo-1', 'stage:in-progress');
+    await adapter.listBacklogIdsInOrder();
+    expect(listCalls()).toBe(2);
+  });
+
   it('returns cheap ranked backlog summaries without snapshot hydration', async () => {
     process.env.PLANE_API_KEY = 'test-key';
     process.env.PLANE_BASE_URL = 'https://plane.example';
 
     const fetchMock = vi.fn(async () => ({
       ok: true,
+      headers: new Headers(),
       json: async () => ({
         results: [
           {
@@ -754,6 +973,134 @@ describe('PlaneAdapter', () => {
     ]);
   });
 
+  it('implements setStage via the Plane API when credentials are available', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: true,
+      status: 200,
+      headers: new Headers(),
+      text: async () => '',
+    });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    (execa as any as ExecaMock)
+      // fetchStates()
+      .mockResolvedValueOnce({
+        stdout: JSON.stringify([
+          { id: 's1', name: 'Backlog' },
+          { id: 's2', name: 'Doing' }
+        ])
+      });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      stageMap: {
+        Doing: 'stage:in-progress',
+        Backlog: 'stage:todo',
+      },
+    });
+
+    await adapter.setStage('i1', 'stage:in-progress');
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock).toHaveBeenCalledWith(
+      'https://plane.example/api/v1/workspaces/ws/projects/proj/work-items/i1/',
+      {
+        method: 'PATCH',
+        headers: {
+          'Content-Type': 'application/json',
+          'x-api-key': 'test-key',
+        },
+        body: JSON.stringify({ state: 's2' }),
+      },
+    );
+    const calls = (execa as any).mock.calls.map((c: any) => c[1]);
+    expect(calls).toEqual([['-f', 'json', 'states', '-p', 'proj']]);
+  });
+
+  it('surfaces a rejected Plane API key instead of falling back to the CLI', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: false,
+      status: 401,
+      headers: new Headers(),
+      text: async () => 'invalid api key',
+    });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    (execa as any as ExecaMock)
+      // fetchStates()
+      .mockResolvedValueOnce({
+        stdout: JSON.stringify([
+          { id: 's1', name: 'Backlog' },
+          { id: 's2', name: 'Doing' }
+        ])
+      });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      stageMap: {
+        Doing: 'stage:in-progress',
+        Backlog: 'stage:todo',
+      },
+    });
+
+    await expect(adapter.setStage('i1', 'stage:in-progress')).rejects.toThrow('HTTP 401');
+    await expect(adapter.fetchSnapshot()).rejects.toThrow('HTTP 401');
+
+    const calls = (execa as any).mock.calls.map((c: any) => c[1]);
+    expect(calls).toEqual([['-f', 'json', 'states', '-p', 'proj']]);
+  });
+
+  it('implements setStages with one states lookup and concurrent API updates', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce({ ok: true, status: 200, headers: new Headers(), text: async () => '' })
+      .mockResolvedValueOnce({ ok: false, status: 500, headers: new Headers(), text: async () => 'boom' });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    (execa as any as ExecaMock)
+      // fetchStates()
+      .mockResolvedValueOnce({
+        stdout: JSON.stringify([
+          { id: 's1', name: 'Backlog' },
+          { id: 's2', name: 'Doing' }
+        ])
+      })
+      // CLI fallback for the rejected update
+      .mockResolvedValueOnce({ stdout: '{}' });
+
+    const adapter = new PlaneAdapter({
+      workspaceSlug: 'ws',
+      projectId: 'proj',
+      stageMap: {
+        Doing: 'stage:in-progress',
+        Backlog: 'stage:todo',
+      },
+    });
+
+    await adapter.setStages([
+      { id: 'i1', stage: 'stage:todo' },
+      { id: 'i2', stage: 'stage:todo' },
+    ]);
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    const calls = (execa as any).mock.calls.map((c: any) => c[1]);
+    expect(calls).toEqual([
+      ['-f', 'json', 'states', '-p', 'proj'],
+      ['-f', 'json', 'issues', 'update', '-p', 'proj', '--state', 's1', 'i2'],
+    ]);
+  });
+
   it('getWorkItem hydrates body/description from issue details for show/autopilot output', async () => {
     (execa as any as ExecaMock)
       .mockResolvedValueOnce({
@@ -840,6 +1187,90 @@ describe('PlaneAdapter', () => {
     expect((execa as any).mock.calls[1]?.[1]).toEqual(['-f', 'json', 'issues', 'list', '-p', 'proj']);
   });
 
+  it('replays the on-disk cache ETag and reuses cached issues on 304', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+    process.env.KWF_PLANE_CACHE_ENABLED = '1';
+    const cachePath = path.resolve(process.cwd(), '.tmp', 'kwf-plane-cache', 'proj-etag.json');
+    await fs.mkdir(path.dirname(cachePath), { recursive: true });
+    await fs.writeFile(cachePath, JSON.stringify({
+      version: 1,
+      projectId: 'proj-etag',
+      refreshedAt: '2020-01-01T00:00:00.000Z',
+      etag: 'W/"v1"',
+      issuesById: { c1: { id: 'c1', name: 'Cached', state: { name: 'stage:todo' } } },
+    }));
+
+    const fetchMock = vi.fn().mockResolvedValue({ ok: false, status: 304, headers: new Headers(), text: async () => '' });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    try {
+      const adapter = new PlaneAdapter({
+        workspaceSlug: 'ws',
+        projectId: 'proj-etag',
+        stageMap: { 'stage:todo': 'stage:todo' },
+      });
+
+      const snap = await adapter.fetchSnapshot();
+
+      expect(Array.from(snap.keys())).toEqual(['c1']);
+      expect(snap.get('c1')?.title).toBe('Cached');
+      expect(fetchMock).toHaveBeenCalledWith('https://plane.example/api/v1/workspaces/ws/projects/proj-etag/issues/', {
+        method: 'GET',
+        headers: { 'x-api-key': 'test-key', 'If-None-Match': 'W/"v1"' },
+      });
+      const saved = JSON.parse(await fs.readFile(cachePath, 'utf-8'));
+      expect(saved.etag).toBe('W/"v1"');
+      expect(saved.refreshedAt).not.toBe('2020-01-01T00:00:00.000Z');
+    } finally {
+      delete process.env.KWF_PLANE_CACHE_ENABLED;
+      await fs.rm(cachePath, { force: true });
+    }
+  });
+
+  it('does not persist the ETag of a multi-page issue list', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example';
+    process.env.KWF_PLANE_CACHE_ENABLED = '1';
+    const cachePath = path.resolve(process.cwd(), '.tmp', 'kwf-plane-cache', 'proj-pages.json');
+    await fs.rm(cachePath, { force: true });
+
+    const page = (results: unknown[], extra: Record<string, unknown> = {}) => ({
+      ok: true,
+      status: 200,
+      headers: new Headers({ etag: 'W/"p1"' }),
+      json: async () => ({ results, ...extra }),
+      text: async () => '',
+    });
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(page([{ id: 'p1', name: 'One', state: { name: 'stage:todo' } }], {
+        next_page_results: true,
+        next_cursor: '1:1:0',
+        total_pages: 2,
+      }))
+      .mockResolvedValueOnce(page([{ id: 'p2', name: 'Two', state: { name: 'stage:todo' } }]));
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    try {
+      const adapter = new PlaneAdapter({
+        workspaceSlug: 'ws',
+        projectId: 'proj-pages',
+        stageMap: { 'stage:todo': 'stage:todo' },
+      });
+
+      const snap = await adapter.fetchSnapshot();
+
+      expect(Array.from(snap.keys())).toEqual(['p1', 'p2']);
+      const saved = JSON.parse(await fs.readFile(cachePath, 'utf-8'));
+      expect(Object.keys(saved.issuesById)).toEqual(['p1', 'p2']);
+      expect(saved.etag).toBeUndefined();
+    } finally {
+      delete process.env.KWF_PLANE_CACHE_ENABLED;
+      await fs.rm(cachePath, { force: true });
+    }
+  });
+
   it('implements addComment via Plane comment API', async () => {
     const oldKey = process.env.PLANE_API_KEY;
     const oldBase = process.env.PLANE_BASE_URL;
@@ -849,6 +1280,7 @@ describe('PlaneAdapter', () => {
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
       status: 200,
+      headers: new Headers(),
       text: async () => '',
     });
     vi.stubGlobal('fetch', fetchMock as any);
@@ -907,6 +1339,7 @@ describe('PlaneAdapter', () => {
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
       status: 200,
+      headers: new Headers(),
       text: async () => '',
     });
     vi.stubGlobal('fetch', fetchMock as any);
@@ -969,6 +1402,7 @@ describe('PlaneAdapter', () => {
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
       status: 200,
+      headers: new Headers(),
       text: async () => '',
     });
     vi.stubGlobal('fetch', fetchMock as any);
@@ -1004,6 +1438,7 @@ describe('PlaneAdapter', () => {
     const fetchMock = vi.fn().mockResolvedValue({
       ok: true,
       status: 200,
+      headers: new Headers(),
       json: async () => ({
         results: [
           {
@@ -1047,6 +1482,7 @@ describe('PlaneAdapter', () => {
       .mockResolvedValueOnce({
         ok: true,
         status: 200,
+        headers: new Headers(),
         json: async () => [],
         text: async () => '',
       })
@@ -1054,6 +1490,7 @@ describe('PlaneAdapter', () => {
       .mockResolvedValueOnce({
         ok: true,
         status: 201,
+        headers: new Headers(),
         text: async () => '',
       });
     vi.stubGlobal('fetch', fetchMock as any);
@@ -0,0 +1,207 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { PlaneApiBroker, PlaneApiClient } from '../src/adapters/plane_api.js';
+
+function response(status: number, headers: Record<string, string> = {}, body: unknown = {}) {
+  return {
+    ok: status >= 200 && status < 300,
+    status,
+    headers: new Headers(headers),
+    json: async () => body,
+    text: async () => '',
+  };
+}
+
+describe('PlaneApiClient', () => {
+  beforeEach(() => {
+    vi.unstubAllGlobals();
+    delete process.env.PLANE_API_KEY;
+    delete process.env.PLANE_BASE_URL;
+  });
+
+  it('requires PLANE_API_KEY', () => {
+    const api = new PlaneApiClient({ workspaceSlug: 'ws' });
+
+    expect(api.hasCredentials()).toBe(false);
+    expect(() => api.projectUrl('proj', 'issues/', 'Plane issues API')).toThrow(
+      'PLANE_API_KEY is required for Plane issues API',
+    );
+  });
+
+  it('builds project URLs from PLANE_BASE_URL', () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    process.env.PLANE_BASE_URL = 'https://plane.example/';
+    const api = new PlaneApiClient({ workspaceSlug: 'ws' });
+
+    expect(api.projectUrl('proj', 'issues/', 'Plane issues API')).toBe(
+      'https://plane.example/api/v1/workspaces/ws/projects/proj/issues/',
+    );
+  });
+
+  it('retries 429 responses honoring Retry-After', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(response(429, { 'retry-after': '0.01' }))
+      .mockResolvedValueOnce(response(200));
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const api = new PlaneApiClient({ workspaceSlug: 'ws' });
+    const res = await api.request('https://plane.example/x', { method: 'GET' }, 'Plane issues API');
+
+    expect(res.status).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(fetchMock).toHaveBeenCalledWith('https://plane.example/x', {
+      method: 'GET',
+      headers: { 'x-api-key': 'test-key' },
+    });
+  });
+
+  it('waits for the rate-limit reset once the window is exhausted', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    const resetAt = String((Date.now() + 50) / 1000);
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(response(200, { 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': resetAt }))
+      .mockResolvedValueOnce(response(200));
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const api = new PlaneApiClient({ workspaceSlug: 'ws' });
+    await api.request('https://plane.example/a', { method: 'GET' }, 'Plane issues API');
+    const startedAt = Date.now();
+    await api.request('https://plane.example/b', { method: 'GET' }, 'Plane issues API');
+
+    expect(Date.now() - startedAt).toBeGreaterThanOrEqual(30);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('shares an exhausted rate-limit window across clients on the same broker', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    const resetAt = String((Date.now() + 50) / 1000);
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(response(200, { 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': resetAt }))
+      .mockResolvedValueOnce(response(200));
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const broker = new PlaneApiBroker();
+    const first = new PlaneApiClient({ workspaceSlug: 'ws', broker });
+    const second = new PlaneApiClient({ workspaceSlug: 'other', broker });
+    await first.request('https://plane.example/a', { method: 'GET' }, 'Plane issues API');
+    const startedAt = Date.now();
+    await second.request('https://plane.example/b', { method: 'GET' }, 'Plane issues API');
+
+    expect(Date.now() - startedAt).toBeGreaterThanOrEqual(30);
+  });
+
+  it('holds queued concurrent callers until an exhausted window resets', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    let closedUntilMs = 0;
+    let active = 0;
+    let peak = 0;
+    const sentWhileClosed: number[] = [];
+    const fetchMock = vi.fn(async () => {
+      if (Date.now() < closedUntilMs - 2) sentWhileClosed.push(Date.now());
+      active += 1;
+      peak = Math.max(peak, active);
+      await new Promise((resolve) => setTimeout(resolve, 2));
+      active -= 1;
+      // Every response reports an exhausted window that resets 40ms out.
+      closedUntilMs = Date.now() + 40;
+      return response(200, { 'x-ratelimit-remaining': '0', 'x-ratelimit-reset': String(closedUntilMs / 1000) });
+    });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const api = new PlaneApiClient({ workspaceSlug: 'ws', broker: new PlaneApiBroker({ maxInFlight: 3 }) });
+    await api.request('https://plane.example/prime', { method: 'GET' }, 'Plane issues API');
+    const startedAt = Date.now();
+
+    await Promise.all(
+      Array.from({ length: 8 }, (_, i) => api.request(`https://plane.example/${i}`, { method: 'GET' }, 'Plane issues API')),
+    );
+
+    expect(fetchMock).toHaveBeenCalledTimes(9);
+    expect(sentWhileClosed).toEqual([]);
+    expect(peak).toBeLessThanOrEqual(3);
+    // 8 callers at <= 3 per window need at least three windows.
+    expect(Date.now() - startedAt).toBeGreaterThanOrEqual(90);
+  });
+
+  it('pauses other callers on the broker while a 429 Retry-After runs out', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    const sent: Array<{ url: string; at: number }> = [];
+    let limited = true;
+    const fetchMock = vi.fn(async (url: string) => {
+      sent.push({ url, at: Date.now() });
+      if (limited && url.endsWith('/a')) {
+        limited = false;
+        return response(429, { 'retry-after': '0.08' });
+      }
+      return response(200);
+    });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const broker = new PlaneApiBroker();
+    const first = new PlaneApiClient({ workspaceSlug: 'ws', broker });
+    const second = new PlaneApiClient({ workspaceSlug: 'other', broker });
+    const startedAt = Date.now();
+    const pending = first.request('https://plane.example/a', { method: 'GET' }, 'Plane issues API');
+    await new Promise((resolve) => setTimeout(resolve, 10));
+    await second.request('https://plane.example/b', { method: 'GET' }, 'Plane issues API');
+    await pending;
+
+    expect(sent.map((s) => s.url).sort()).toEqual([
+      'https://plane.example/a',
+      'https://plane.example/a',
+      'https://plane.example/b',
+    ]);
+    // b was issued 10ms in, while a's Retry-After held the shared window closed.
+    expect(sent.find((s) => s.url.endsWith('/b'))!.at - startedAt).toBeGreaterThanOrEqual(70);
+  });
+
+  it('caps concurrent requests at the broker limit', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    let active = 0;
+    let peak = 0;
+    const fetchMock = vi.fn(async () => {
+      active += 1;
+      peak = Math.max(peak, active);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      active -= 1;
+      return response(200);
+    });
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const api = new PlaneApiClient({ workspaceSlug: 'ws', broker: new PlaneApiBroker({ maxInFlight: 2 }) });
+    await Promise.all(
+      ['a', 'b', 'c', 'd', 'e'].map((p) => api.request(`https://plane.example/${p}`, { method: 'GET' }, 'Plane issues API')),
+    );
+
+    expect(fetchMock).toHaveBeenCalledTimes(5);
+    expect(peak).toBe(2);
+  });
+
+  it('replays ETags as If-None-Match and reuses the body on 304', async () => {
+    process.env.PLANE_API_KEY = 'test-key';
+    const fetchMock = vi
+      .fn()
+      .mockResolvedValueOnce(response(200, { etag: 'W/"v1"' }, { results: [{ id: 'i1' }] }))
+      .mockResolvedValueOnce(response(304));
+    vi.stubGlobal('fetch', fetchMock as any);
+
+    const api = new PlaneApiClient({ workspaceSlug: 'ws' });
+    const first = await api.getJson('https://plane.example/issues/', 'Plane issues API');
+    const second = await api.getJson('https://plane.example/issues/', 'Plane issues API');
+
+    expect(second).toBe(first);
+    expect(fetchMock).toHaveBeenNthCalledWith(1, 'https://plane.example/issues/', {
+      method: 'GET',
+      headers: { 'x-api-key': 'test-key' },
+    });
+    expect(fetchMock).toHaveBeenNthCalledWith(2, 'https://plane.example/issues/', {
+      method: 'GET',
+      headers: { 'x-api-key': 'test-key', 'If-None-Match': 'W/"v1"' },
+    });
+    expect(api.conditionalEntry('https://plane.example/issues/')?.etag).toBe('W/"v1"');
+  });
+});
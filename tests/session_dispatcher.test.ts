@@ -1,9 +1,14 @@
 import { describe, expect, it } from 'vitest';
+import * as fs from 'node:fs/promises';
+import * as os from 'node:os';
+import * as path from 'node:path';
 
 import {
   applyWorkerCommandToSessionMap,
   buildWorkflowLoopPlan,
+  loadSessionMap,
   markSessionInProgress,
+  saveSessionMap,
 } from '../src/automation/session_dispatcher.js';
 
 describe('session workflow-loop', () => {
@@ -536,4 +541,20 @@ describe('session workflow-loop', () => {
     expect(promoted.sessionsByTicket.A1?.lastSeenAt).toBe('2026-02-28T13:01:00.000Z');
     expect(promoted.active).toEqual({ ticketId: 'A1', sessionId: 'kwf-A1-1' });
   });
+
+  it('persists the session map atomically and skips unchanged rewrites', async () => {
+    const dir = await fs.mkdtemp(path.join(os.tmpdir(), 'kwf-session-map-'));
+    const mapPath = path.join(dir, 'map.json');
+    const map = { version: 1 as const, sessionsByTicket: {} };
+
+    await saveSessionMap(map, mapPath);
+    const firstMtime = (await fs.stat(mapPath)).mtimeMs;
+    await new Promise((resolve) => setTimeout(resolve, 20));
+    await saveSessionMap({ version: 1, sessionsByTicket: {} }, mapPath);
+
+    expect((await fs.stat(mapPath)).mtimeMs).toBe(firstMtime);
+    expect(await fs.readdir(dir)).toEqual(['map.json']);
+    expect(await loadSessionMap(mapPath)).toMatchObject({ version: 1, sessionsByTicket: {} });
+    await fs.rm(dir, { recursive: true, force: true });
+  });
 });
@@ -13,6 +13,21 @@ describe('Stage.fromAny', () => {
     expect(Stage.fromAny('stage/in-review').key).toBe('stage:in-review');
   });
 
+  it('returns the shared instance for every spelling of a stage', () => {
+    const inProgress = Stage.fromAny('stage:in-progress');
+    expect(Stage.fromAny('In Progress')).toBe(inProgress);
+    expect(Stage.fromAny('  in__progress ')).toBe(inProgress);
+    expect(Stage.fromAny('backlog')).toBe(Stage.fromAny('stage:todo'));
+    expect(Object.isFrozen(inProgress)).toBe(true);
+  });
+
+  it('exposes the shared instances as Stage constants', () => {
+    expect(Stage.fromAny('In Progress')).toBe(Stage.IN_PROGRESS);
+    expect(Stage.fromAny('In Review')).toBe(Stage.IN_REVIEW);
+    expect(Stage.fromAny('BLOCKED')).toBe(Stage.BLOCKED);
+    expect(Stage.fromAny('backlog')).toBe(Stage.TODO);
+  });
+
   it('rejects unknown stages', () => {
     expect(() => Stage.fromAny('stage:banana')).toThrow(/Unknown stage/);
   });
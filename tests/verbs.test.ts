@@ -0,0 +1,67 @@
+import { describe, expect, it } from 'vitest';
+
+import { ask, complete } from '../src/verbs/verbs.js';
+import type { VerbAdapter } from '../src/verbs/types.js';
+
+function fakeAdapter(opts: { failComment?: boolean; failPrepare?: boolean } = {}) {
+  const calls: string[] = [];
+  const adapter = {
+    addComment: async (id: string, body: string) => {
+      calls.push(`comment ${id} ${body}`);
+      // Let a concurrent prepareStage record itself before the comment settles.
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      if (opts.failComment) throw new Error('mention rendering failed');
+      calls.push(`commented ${id}`);
+    },
+    prepareStage: async (id: string, stage: string) => {
+      calls.push(`prepare ${id} ${stage}`);
+      if (opts.failPrepare) throw new Error('states lookup failed');
+    },
+    setStage: async (id: string, stage: string) => {
+      calls.push(`stage ${id} ${stage}`);
+    },
+  } as unknown as VerbAdapter;
+  return { adapter, calls };
+}
+
+describe('verbs', () => {
+  it('ask posts the question before blocking the ticket', async () => {
+    const { adapter, calls } = fakeAdapter();
+
+    await ask(adapter, 'T-1', 'Which API?');
+
+    expect(calls).toEqual([
+      'comment T-1 Which API?',
+      'prepare T-1 stage:blocked',
+      'commented T-1',
+      'stage T-1 stage:blocked',
+    ]);
+  });
+
+  it('complete still moves the stage when the stage warm-up fails', async () => {
+    const { adapter, calls } = fakeAdapter({ failPrepare: true });
+
+    await complete(adapter, 'T-1', 'done');
+
+    expect(calls).toEqual([
+      'comment T-1 Completed: done',
+      'prepare T-1 stage:in-review',
+      'commented T-1',
+      'stage T-1 stage:in-review',
+    ]);
+  });
+
+  it('ask leaves the stage alone when the question cannot be posted', async () => {
+    const { adapter, calls } = fakeAdapter({ failComment: true });
+
+    await expect(ask(adapter, 'T-1', 'Which API?')).rejects.toThrow('mention rendering failed');
+    expect(calls).toEqual(['comment T-1 Which API?', 'prepare T-1 stage:blocked']);
+  });
+
+  it('complete leaves the stage alone when the summary cannot be posted', async () => {
+    const { adapter, calls } = fakeAdapter({ failComment: true });
+
+    await expect(complete(adapter, 'T-1', 'done')).rejects.toThrow('mention rendering failed');
+    expect(calls).toEqual(['comment T-1 Completed: done', 'prepare T-1 stage:in-review']);
+  });
+});
@@ -196,6 +196,45 @@ describe('workflow_loop_selection', () => {
     expect(adapter.setStage).toHaveBeenCalledWith('A1', 'stage:todo');
   });
 
+  it('demotes several extra in-progress tickets through the bulk setStages port', async () => {
+    const adapter = {
+      whoami: vi.fn(async () => ({ id: 'me-1', username: 'kwf-bot' })),
+      listOwnInProgressItems: vi.fn(async () => [
+        { id: 'A3', updatedAt: new Date('2026-03-10T02:00:00.000Z') },
+        { id: 'A2', updatedAt: new Date('2026-03-10T01:00:00.000Z') },
+        { id: 'A1', updatedAt: new Date('2026-03-10T00:00:00.000Z') },
+      ]),
+      listIdsByStage: vi.fn(async () => []),
+      getWorkItem: vi.fn(async (id: string) => ({
+        id,
+        title: id,
+        stage: 'stage:in-progress' as const,
+        assignees: [{ id: 'me-1' }],
+        labels: [],
+      })),
+      setStage: vi.fn(async () => undefined),
+      setStages: vi.fn(async () => undefined),
+      listBacklogIdsInOrder: vi.fn(async () => []),
+      listComments: vi.fn(async () => []),
+      listAttachments: vi.fn(async () => []),
+      listLinkedWorkItems: vi.fn(async () => []),
+      name: vi.fn(() => 'plane'),
+    };
+
+    const output = await runWorkflowLoopSelection({
+      adapter,
+      map: { version: 1, sessionsByTicket: {} },
+      dryRun: false,
+    });
+
+    expect(output.tick).toEqual({ kind: 'in_progress', id: 'A3', inProgressIds: ['A3'] });
+    expect(adapter.setStages).toHaveBeenCalledWith([
+      { id: 'A2', stage: 'stage:todo' },
+      { id: 'A1', stage: 'stage:todo' },
+    ]);
+    expect(adapter.setStage).not.toHaveBeenCalled();
+  });
+
   it('uses adapter-provided backlog summaries to avoid per-ticket work item reads', async () => {
     const adapter = {
       whoami: vi.fn(async () => ({ id: 'me-1', username: 'kwf-bot' })),